@@ -0,0 +1,386 @@
+import os
+import re
+import mmap
+import sys
+import hashlib
+import importlib
+from dataclasses import dataclass
+from functools import cached_property, lru_cache, wraps
+from itertools import chain, islice, repeat
+from pathlib import Path
+from inspect import cleandoc
+from typing import Callable, Dict, Optional, Tuple
+
+from aoc.checkpoint import Checkpoint
+from aoc.metrics import count, gauge
+
+# heavy dependencies are imported where they are used, so importing a day costs next to nothing
+
+symbols = {'ok': ('✔︎', 'green'), 'fail': ('✘', 'red')}
+
+
+def __getattr__(name):
+    if name in symbols:
+        import click
+        symbol, color = symbols[name]
+        return click.style(symbol, fg=color)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+cache_dir = Path('cache')
+
+
+def frozen(arr):
+    arr.flags.writeable = False
+    return arr
+
+
+def persisted(f):
+    '''
+    Cached array property which is also stored on disk for inputs from load_input.
+
+    Files are keyed by the input hash, later runs memory-map them instead of parsing.
+    '''
+    @cached_property
+    @wraps(f)
+    def wrapper(self):
+        import numpy as np
+        if not self.persistent:
+            return frozen(f(self))
+        path = cache_dir / 'parsed' / f'{self.digest}.{f.__name__}.npy'
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f'.{os.getpid()}.tmp')
+            with tmp.open('wb') as fh:
+                np.save(fh, f(self))
+            tmp.replace(path)
+        return np.load(path, mmap_mode='r')
+    return wrapper
+
+
+def shared(f):
+    '''
+    Memoize a helper taking the input first, so both parts of a day share its result.
+
+    Results live on the Data instance, so they go away with it and a different input starts over.
+    A result is kept along with the helper which made it, so a reloaded module recomputes it.
+    Other strings are not memoized. Treat the results as read-only.
+    '''
+    @wraps(f)
+    def wrapper(data, *args):
+        if not isinstance(data, Data):
+            return f(data, *args)
+        key = f.__module__, f.__qualname__, args
+        helper, result = data.memo.get(key, (None, None))
+        if helper is not f:
+            result = f(data, *args)
+            data.memo[key] = f, result
+        return result
+    return wrapper
+
+
+class Data(str):
+    '''
+    Puzzle input with parsed views.
+
+    Every view is parsed once and cached on the instance, so treat the results as read-only.
+    '''
+    persistent = False
+
+    @cached_property
+    def digest(self):
+        return hashlib.sha256(self.encode()).hexdigest()
+
+    @cached_property
+    def memo(self):
+        '''results of shared helpers, see aoc.shared'''
+        return {}
+
+    @cached_property
+    def lines(self):
+        return self.splitlines()
+
+    @cached_property
+    def int_lines(self):
+        return [int(x) for x in self.splitlines()]
+
+    @cached_property
+    def ints_lines(self):
+        return [
+            [int(x) for x in re.findall(r'-?\d+', line)]
+            for line in self.splitlines()
+        ]
+
+    @persisted
+    def int_array(self):
+        import numpy as np
+        return np.array(self.int_lines, dtype=np.int64)
+
+    @persisted
+    def ints_array(self):
+        '''2d array of ints_lines, only for rectangular inputs'''
+        import numpy as np
+        if len({len(x) for x in self.ints_lines}) > 1:
+            raise ValueError('ragged input, use ints_ragged')
+        return np.array(self.ints_lines, dtype=np.int64).reshape(len(self.ints_lines), -1)
+
+    @persisted
+    def ints_flat(self):
+        import numpy as np
+        return np.fromiter(chain.from_iterable(self.ints_lines), dtype=np.int64)
+
+    @persisted
+    def ints_offsets(self):
+        import numpy as np
+        offsets = np.zeros(len(self.ints_lines) + 1, dtype=np.int64)
+        np.cumsum([len(x) for x in self.ints_lines], out=offsets[1:])
+        return offsets
+
+    @property
+    def ints_ragged(self):
+        '''flat values and row offsets, row i is values[offsets[i]:offsets[i + 1]]'''
+        return self.ints_flat, self.ints_offsets
+
+    def ints_chunks(self, size=2 ** 16):
+        '''ints_array in blocks of rows, same interface as Stream'''
+        for i in range(0, len(self.ints_array), size):
+            yield self.ints_array[i:i + size]
+
+    @cached_property
+    def grid(self):
+        '''
+        Characters as a 2d uint8 array, short rows are padded with spaces.
+
+        Encoding the text copies it, once more when it lacks a trailing newline. Rows of a rectangular input
+        are a view of those bytes which steps over the newlines, ragged inputs are copied again to pad them.
+        '''
+        import numpy as np
+        raw = self.encode()
+        if raw and not raw.endswith(b'\n'):
+            raw += b'\n'
+        flat = np.frombuffer(raw, dtype=np.uint8)
+        ends = np.flatnonzero(flat == ord('\n'))
+        widths = np.diff(ends, prepend=-1) - 1
+        width = int(widths.max(initial=0))
+        if (widths == width).all():
+            return flat.reshape(len(ends), width + 1)[:, :width]
+        grid = np.full((len(ends), width), ord(' '), dtype=np.uint8)
+        grid[np.arange(width) < widths[:, None]] = flat[flat != ord('\n')]
+        return frozen(grid)
+
+    def codes(self, symbols):
+        '''grid with each character replaced by its index in symbols, see encode_grid'''
+        return encode_grid(self.grid, symbols)
+
+
+def encode_grid(grid, symbols):
+    '''
+    Small integer codes of a uint8 grid of characters, the index of each one in symbols.
+
+    A lookup table translates the whole grid in one pass, any other character is an error.
+    '''
+    import numpy as np
+    table = np.full(256, len(symbols), dtype=np.uint8)
+    table[np.frombuffer(symbols.encode(), dtype=np.uint8)] = np.arange(len(symbols))
+    codes = table[grid]
+    unknown = codes == len(symbols)
+    if unknown.any():
+        raise ValueError(f'unexpected symbols {sorted(set(grid[unknown].tobytes().decode()))}')
+    return codes
+
+
+def decode_grid(codes, symbols):
+    '''text of a grid of codes, one line per row'''
+    import numpy as np
+    table = np.frombuffer(symbols.encode(), dtype=np.uint8)
+    return '\n'.join(row.tobytes().decode() for row in table[codes])
+
+
+class Stream:
+    '''
+    Line oriented view of an input file which is never loaded whole, for inputs larger than memory.
+
+    Every property is a fresh generator over a memory map, so it can be iterated more than once.
+    '''
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    @cached_property
+    def digest(self):
+        with self.path.open('rb') as f:
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+
+    @property
+    def lines(self):
+        if not self.path.stat().st_size:
+            return
+        with self.path.open('rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b''):
+                yield line.rstrip(b'\r\n').decode()
+
+    @property
+    def int_lines(self):
+        return (int(x) for x in self.lines)
+
+    @property
+    def ints_lines(self):
+        return (
+            [int(x) for x in re.findall(r'-?\d+', line)]
+            for line in self.lines
+        )
+
+    def ints_chunks(self, size=2 ** 16):
+        '''ints_lines as 2d int64 arrays of up to size rows'''
+        import numpy as np
+        rows = self.ints_lines
+        while True:
+            chunk = list(islice(rows, size))
+            if not chunk:
+                return
+            yield np.array(chunk, dtype=np.int64).reshape(len(chunk), -1)
+
+
+@dataclass
+class Solver:
+    day: int
+    part: str
+    cases: dict
+    f: Callable
+    timeout: Optional[float] = None
+    memory: Optional[float] = None
+    stream: bool = False
+
+
+registry: Dict[Tuple[int, str], Solver] = {}
+batches: Dict[Tuple[int, str], Callable] = {}
+references: Dict[Tuple[int, str], Tuple[Callable, Optional[int], bool]] = {}
+
+
+def test(cases, timeout=None, memory=None, stream=False):
+    '''
+    Register a solver with its example cases, optionally limited to timeout seconds and memory MB per run.
+
+    Pass stream=True when it only uses views a Stream has too, then run and bench --stream feed it one.
+
+    Nothing runs at import, a day run as a script is checked once all of its parts are registered.
+    '''
+    def decorator(f):
+        module = sys.modules[f.__module__]
+        day = day_of(module.__file__)
+        registry[day, f.__name__] = Solver(day, f.__name__, cases, f, timeout, memory, stream)
+        if module.__name__ == '__main__':
+            solvers = [registry.get((day, name)) for name in part_names(day)]
+            if all(solvers):
+                from aoc import harness
+                harness.main(solvers)
+        return f
+    return decorator
+
+
+def batched(part):
+    '''register a path solving a list of inputs for a part at once'''
+    def decorator(f):
+        day = day_of(sys.modules[f.__module__].__file__)
+        batches[day, part] = f
+        return f
+    return decorator
+
+
+def reference(part, scale=None, real=True):
+    '''
+    Register a slow but plain implementation of a part, checked against it on inputs generated at scale.
+
+    Pass real=False when it can't solve a real input in time, it is then only checked on generated ones.
+    '''
+    def decorator(f):
+        day = day_of(sys.modules[f.__module__].__file__)
+        references[day, part] = f, scale, real
+        return f
+    return decorator
+
+
+def solve_batch(day, part, texts):
+    f = parts(day)[part]
+    datas = [Data(text) for text in texts]
+    if (day, part) in batches:
+        return list(batches[day, part](datas))
+    return [f(data) for data in datas]
+
+
+def batch(day, part, inputs, jobs=None):
+    '''
+    Solve many inputs of one day, yielding results in input order.
+
+    Inputs are split in chunks between worker processes, each importing the day once.
+    '''
+    from concurrent.futures import ProcessPoolExecutor
+    inputs = list(inputs)
+    jobs = jobs or os.cpu_count()
+    size = max(1, -(-len(inputs) // (jobs * 4)))
+    chunks = [inputs[i:i + size] for i in range(0, len(inputs), size)]
+    with ProcessPoolExecutor(jobs) as pool:
+        for results in pool.map(solve_batch, repeat(day), repeat(part), chunks):
+            yield from results
+
+
+def day_of(path):
+    return int(re.search(r'\d+', Path(path).name).group(0))
+
+
+def available_days():
+    return [day_of(path) for path in sorted(Path().glob('day[0-9][0-9].py'))]
+
+
+def part_names(day):
+    '''solver names of a day, found without importing it'''
+    source = Path(f'day{day:02d}.py').read_text()
+    return re.findall(r'^def (part_\w+)', source, re.M)
+
+
+def parts(day):
+    '''solver functions of a day, importing it as a regular module only registers them'''
+    importlib.import_module(f'day{day:02d}')
+    return {part: solver.f for (d, part), solver in registry.items() if d == day}
+
+
+def input_file(day):
+    return Path(f'inputs/day{day:02d}.txt')
+
+
+def download_input(day):
+    from aoc import download
+    text = download.fetch(day)
+    download.store({day: text})
+    print(f'downloaded input for day {day}')
+    return text
+
+
+def read_input(day):
+    '''a plain file in inputs/ wins over the archive, anything else is downloaded'''
+    from aoc import download
+    path = input_file(day)
+    if path.exists():
+        return path.read_text()
+    text = download.archived(day)
+    if text is None:
+        text = download_input(day)
+    return text
+
+
+@lru_cache()
+def load_input(day):
+    '''the same Data is shared between parts, so parsed views are reused'''
+    data = Data(read_input(day))
+    data.persistent = True
+    return data
+
+
+def stream_input(day):
+    '''like load_input, but streamed from disk, so archived inputs are extracted first'''
+    path = input_file(day)
+    if not path.exists():
+        text = read_input(day)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    return Stream(path)
@@ -0,0 +1,161 @@
+import click
+
+import aoc
+from aoc import bench, daemon, differential, download, generate, harness, history, profiling, runner, watch
+
+
+def parse_days(ctx, param, value):
+    '''parse day ranges like 1-25 or 3,5,7-9'''
+    days = []
+    try:
+        for chunk in value.split(','):
+            a, _, b = chunk.partition('-')
+            days.extend(range(int(a), int(b or a) + 1))
+    except ValueError:
+        raise click.BadParameter(value)
+    available = set(aoc.available_days())
+    return [day for day in days if day in available]
+
+
+@click.group()
+def cli():
+    pass
+
+
+@cli.command('bench')
+@click.argument('days', default='1-25', callback=parse_days)
+@click.option('--warmup', default=1, help='untimed runs before measuring')
+@click.option('--repeat', default=5, help='timed runs per part')
+@click.option('--output', default='bench.json', type=click.Path(dir_okay=False), help='json report')
+@click.option('--generated', is_flag=True, help='use synthetic inputs instead of the real ones')
+@click.option('--scale', type=int, help='size of synthetic inputs, see aoc.generate')
+@click.option('--seed', default=0, help='seed for synthetic inputs')
+@click.option('--stream', is_flag=True, help='read inputs from disk for parts that support it')
+def bench_command(days, warmup, repeat, output, generated, scale, seed, stream):
+    '''benchmark solvers against real or synthetic inputs'''
+    bench.run(days, warmup, repeat, output, generated, scale, seed, stream)
+
+
+@cli.command('compare')
+@click.option('--threshold', default=0.1, help='fraction a part may get slower than its baseline')
+@click.option('--window', default=5, help='previous runs making up the baseline')
+def compare_command(threshold, window):
+    '''compare the latest benchmark of each part to its history, fail on regressions'''
+    if history.compare(threshold, window):
+        raise SystemExit(1)
+
+
+@cli.command('diff')
+@click.argument('days', default='1-25', callback=parse_days)
+@click.option('--seeds', default=3, help='generated inputs per part')
+@click.option('--real/--no-real', default=True, help='also compare on the real input')
+@click.option('--timeout', default=60.0, help='seconds a reference may take per input')
+def diff_command(days, seeds, real, timeout):
+    '''check fast solvers against their reference implementations'''
+    if not differential.run(days, seeds, real, timeout):
+        raise SystemExit(1)
+
+
+@cli.command('generate')
+@click.argument('day', type=int)
+@click.option('--scale', type=int, help='size of the input, the meaning depends on the day')
+@click.option('--seed', default=0)
+def generate_command(day, scale, seed):
+    '''print a synthetic input'''
+    click.echo(generate.generate(day, scale, seed))
+
+
+@cli.command('run')
+@click.argument('days', default='1-25', callback=parse_days)
+@click.option('--jobs', '-j', type=int, help='worker processes, defaults to cpu count')
+@click.option('--no-cache', is_flag=True, help='recompute answers even if they are stored')
+@click.option('--stream', is_flag=True, help='read inputs from disk for parts that support it')
+def run_command(days, jobs, no_cache, stream):
+    '''solve many days in parallel, longest parts first'''
+    if not runner.run(days, jobs, use_cache=not no_cache, stream=stream):
+        raise SystemExit(1)
+
+
+@cli.command('test')
+@click.argument('days', default='1-25', callback=parse_days)
+@click.option('--jobs', '-j', type=int, help='worker processes for examples, defaults to cpu count')
+@harness.command_options
+def test_command(days, jobs, **flags):
+    '''check examples concurrently, then solve real inputs'''
+    options = harness.configure(**flags)
+    solvers = [aoc.registry[day, part] for day in days for part in aoc.parts(day)]
+    if not harness.run(solvers, jobs, options):
+        raise SystemExit(1)
+
+
+@cli.command('watch')
+@click.argument('days', default='1-25', callback=parse_days)
+def watch_command(days):
+    '''rerun the parts which changed whenever a day is saved'''
+    watch.watch(days)
+
+
+@cli.command('profile')
+@click.argument('days', callback=parse_days)
+@click.option('--part', help='only profile this part, like part_2')
+@click.option('--top', default=profiling.top, help='functions to show')
+def profile_command(days, part, top):
+    '''profile solvers on real inputs'''
+    profiling.top = top
+    for day in days:
+        for name, f in aoc.parts(day).items():
+            if part in (None, name):
+                click.secho(f'day {day}, {name.replace("_", " ")}')
+                click.secho(f'{profiling.run(day, f, aoc.load_input(day))}\n')
+
+
+@cli.command('prefetch')
+@click.argument('days', default='1-25', callback=parse_days)
+@click.option('--jobs', '-j', default=8, help='concurrent downloads')
+def prefetch_command(days, jobs):
+    '''download missing inputs into the archive, set AOC_URL to use a stand-in'''
+    download.prefetch(days, jobs)
+
+
+@cli.command('serve-inputs')
+@click.option('--port', default=8018)
+@click.option('--generated', is_flag=True, help='serve synthetic inputs instead of local ones')
+@click.option('--seed', default=0, help='seed for synthetic inputs')
+def serve_inputs_command(port, generated, seed):
+    '''local stand-in for the input endpoint, for ci and offline machines'''
+    if generated:
+        download.serve(lambda day: generate.generate(day, seed=seed) if day in generate.generators else None, port)
+    else:
+        download.serve(lambda day: aoc.read_input(day) if not download.missing([day]) else None, port)
+
+
+@cli.command('daemon')
+def daemon_command():
+    '''keep days and inputs loaded, serve solve requests'''
+    daemon.serve()
+
+
+@cli.command('solve')
+@click.argument('day', type=int)
+@click.argument('part')
+@click.option('--no-cache', is_flag=True, help='recompute the answer even if it is stored')
+def solve_command(day, part, no_cache):
+    '''solve a part using a running daemon'''
+    try:
+        response = daemon.request(day=day, part=part, cache=not no_cache)
+    except (FileNotFoundError, ConnectionRefusedError):
+        raise click.ClickException('daemon is not running, start it with python -m aoc daemon')
+    if 'error' in response:
+        raise click.ClickException(response['error'])
+    cached = click.style(' (cached)' * response['cached'], dim=True)
+    click.secho(f'{response["result"]}{cached}  ' + click.style(bench.format_time(response['elapsed']), dim=True))
+
+
+@cli.command('stop')
+def stop_command():
+    '''stop a running daemon'''
+    daemon.request(command='stop')
+
+
+if __name__ == '__main__':
+    cli()
@@ -0,0 +1,145 @@
+import ast
+import hashlib
+import inspect
+import json
+import numbers
+import sys
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+
+root = Path('cache/answers')
+max_size = 2 ** 20
+missing = object()
+
+
+def definitions(tree):
+    '''top level names mapped to the statements that define them'''
+    defs = defaultdict(list)
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            defs[node.name].append(node)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                for name in ast.walk(target):
+                    if isinstance(name, ast.Name):
+                        defs[name.id].append(node)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                defs[(alias.asname or alias.name).split('.')[0]].append(node)
+    return defs
+
+
+def package_sources(tree):
+    '''
+    Trees of the aoc modules imported at the top of a module, and of the ones they import in turn.
+
+    Any of them can hold solver logic (search, cycles, geometry, the parsers of Data), so they are hashed whole.
+    '''
+    package = Path(__file__).parent
+    trees, todo = {}, [tree]
+    while todo:
+        for node in todo.pop().body:
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and not node.level and node.module:
+                names = [node.module] + [f'{node.module}.{alias.name}' for alias in node.names]
+            else:
+                continue
+            for name in names:
+                top, *rest = name.split('.')
+                path = package.joinpath(*rest).with_suffix('.py') if rest else package / '__init__.py'
+                if top != 'aoc' or path in trees or not path.exists():
+                    continue
+                trees[path] = ast.parse(path.read_text())
+                todo.append(trees[path])
+    return [trees[path] for path in sorted(trees)]
+
+
+@lru_cache()
+def source_hash(f):
+    '''
+    Hash of a solver and every module level definition it reaches, ignoring comments and formatting,
+    along with the aoc modules its day imports.
+    '''
+    tree = ast.parse(inspect.getsource(sys.modules[f.__module__]))
+    defs = definitions(tree)
+    seen, todo, nodes = set(), [f.__name__], {}
+    while todo:
+        name = todo.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        for node in defs.get(name, []):
+            nodes[node.lineno] = node
+            todo.extend(x.id for x in ast.walk(node) if isinstance(x, ast.Name))
+    h = hashlib.sha256()
+    for lineno in sorted(nodes):
+        h.update(ast.dump(nodes[lineno]).encode())
+    for module in package_sources(tree):
+        h.update(ast.dump(module).encode())
+    return h.hexdigest()
+
+
+def entry(day, f, data):
+    key = f'{day}:{f.__name__}:{data.digest}:{source_hash(f)}'
+    return root / f'{hashlib.sha256(key.encode()).hexdigest()}.json'
+
+
+def plain(result):
+    '''numpy scalars as python ones, also inside tuples and lists'''
+    if isinstance(result, (tuple, list)):
+        return type(result)(map(plain, result))
+    if isinstance(result, numbers.Number) and hasattr(result, 'item'):
+        return result.item()
+    return result
+
+
+def get(day, f, data):
+    '''answers are stored as their repr, so tuples come back as tuples'''
+    path = entry(day, f, data)
+    try:
+        text = json.loads(path.read_text())
+    except FileNotFoundError:
+        return missing
+    if not isinstance(text, str):
+        return missing
+    path.touch()
+    return ast.literal_eval(text)
+
+
+def put(day, f, data, result):
+    result = plain(result)
+    text = repr(result)
+    try:
+        if ast.literal_eval(text) != result:
+            return
+    except (ValueError, SyntaxError):
+        return  # not worth storing answers which don't round trip
+    path = entry(day, f, data)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(text))
+    evict()
+
+
+def evict():
+    '''drop least recently used answers until the store fits in max_size'''
+    entries = sorted(root.glob('*.json'), key=lambda p: p.stat().st_mtime, reverse=True)
+    total = 0
+    for path in entries:
+        total += path.stat().st_size
+        if total > max_size:
+            path.unlink(missing_ok=True)
+
+
+def solve(day, f, data, use_cache=True):
+    '''returns the answer and whether it came from the store'''
+    if use_cache:
+        result = get(day, f, data)
+        if result is not missing:
+            return result, True
+    result = f(data)
+    if use_cache:
+        put(day, f, data, result)
+    return result, False
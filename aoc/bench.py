@@ -0,0 +1,114 @@
+import json
+import math
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import click
+
+import aoc
+from aoc import download, generate
+
+
+def percentile(times, q):
+    ordered = sorted(times)
+    return ordered[max(math.ceil(q * len(ordered)) - 1, 0)]
+
+
+def peak_rss():
+    '''peak resident set size of this process in bytes'''
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+def format_time(seconds):
+    if seconds < 1:
+        return f'{seconds * 1000:.2f}ms'
+    return f'{seconds:.2f}s'
+
+
+def load_text(day, generated=False, scale=None, seed=0):
+    if generated:
+        return generate.generate(day, scale, seed)
+    return str(aoc.load_input(day))
+
+
+def stream_path(day, generated=False, scale=None, seed=0):
+    '''file to stream an input from, generated inputs are written to cache/generated first'''
+    if not generated:
+        return aoc.stream_input(day).path
+    path = Path(f'cache/generated/day{day:02d}-{scale}-{seed}.txt')
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(generate.generate(day, scale, seed))
+    return path
+
+
+def measure(day, part, warmup=1, repeat=5, generated=False, scale=None, seed=0, stream=False):
+    '''
+    Time a part on its real or a generated input, each run parses a fresh copy of the input.
+
+    With stream, parts registered with stream=True read it from disk instead of from memory.
+    '''
+    f = aoc.parts(day)[part]
+    stream = stream and aoc.registry[day, part].stream
+    if stream:
+        path = stream_path(day, generated, scale, seed)
+        fresh, size = lambda: aoc.Stream(path), path.stat().st_size
+    else:
+        text = load_text(day, generated, scale, seed)
+        fresh, size = lambda: aoc.Data(text), len(text)
+    for _ in range(warmup):
+        f(fresh())
+    times = []
+    for _ in range(repeat):
+        data = fresh()
+        start = time.perf_counter()
+        result = f(data)
+        times.append(time.perf_counter() - start)
+    return {
+        'day': day,
+        'part': part,
+        'result': str(result),
+        'input': {'generated': generated, 'scale': scale, 'seed': seed, 'size': size, 'stream': stream, 'digest': fresh().digest},
+        'runs': repeat,
+        'times': times,
+        'min': min(times),
+        'median': statistics.median(times),
+        'p95': percentile(times, 0.95),
+        'peak_rss': peak_rss(),
+    }
+
+
+def report(stats):
+    part = stats['part'].replace('_', ' ')
+    click.secho(
+        f'day {stats["day"]:2d}, {part:<8}'
+        f'  min {format_time(stats["min"]):>10}'
+        f'  median {format_time(stats["median"]):>10}'
+        f'  p95 {format_time(stats["p95"]):>10}'
+        f'  rss {stats["peak_rss"] / 2**20:7.1f}MB'
+        f'  {stats["result"]}'
+    )
+
+
+def run(days, warmup=1, repeat=5, output=None, generated=False, scale=None, seed=0, stream=False):
+    '''benchmark every part of the days, each part runs in a fresh process to isolate peak rss'''
+    if not generated:
+        download.prefetch(days)
+    results = []
+    for day in days:
+        for part in aoc.part_names(day):
+            with ProcessPoolExecutor(1) as pool:
+                stats = pool.submit(measure, day, part, warmup, repeat, generated, scale, seed, stream).result()
+            report(stats)
+            results.append(stats)
+    if output:
+        with open(output, 'w') as f:
+            json.dump(results, f, indent=2)
+    from aoc import history
+    history.record(results)
+    return results
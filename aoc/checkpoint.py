@@ -0,0 +1,48 @@
+import hashlib
+import os
+import time
+from pathlib import Path
+
+root = Path('cache/checkpoints')
+# --no-checkpoint of a day script or python -m aoc test turns this off
+enabled = True
+# seconds between saves, a save costs a few milliseconds, so this keeps the overhead well under a percent
+interval = float(os.environ.get('AOC_CHECKPOINT_INTERVAL', 30))
+
+
+class Checkpoint:
+    '''
+    State of a long loop, saved as arrays every interval seconds and restored by a rerun with the same key.
+
+    The owner is the top level function or class running the loop, a change to its code discards old checkpoints.
+    '''
+    def __init__(self, owner, *key):
+        from aoc import answers
+        h = hashlib.sha256(f'{owner.__module__}.{owner.__name__}:{answers.source_hash(owner)}'.encode())
+        for part in key:
+            h.update(part if isinstance(part, bytes) else str(part).encode())
+        self.path = root / f'{h.hexdigest()}.npz'
+        self.next = time.monotonic() + interval
+
+    def load(self):
+        '''arrays saved by an earlier run, or None'''
+        import numpy as np
+        if not enabled or not self.path.exists():
+            return None
+        with np.load(self.path) as saved:
+            return {name: saved[name] for name in saved.files}
+
+    def due(self):
+        return enabled and time.monotonic() >= self.next
+
+    def save(self, **arrays):
+        import numpy as np
+        root.mkdir(parents=True, exist_ok=True)
+        temp = self.path.with_suffix('.tmp')
+        with temp.open('wb') as f:
+            np.savez(f, **arrays)
+        temp.replace(self.path)
+        self.next = time.monotonic() + interval
+
+    def clear(self):
+        self.path.unlink(missing_ok=True)
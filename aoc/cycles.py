@@ -0,0 +1,108 @@
+'''
+Cycle detection over a sequence of states, for simulations asked about a step far beyond what can be run.
+
+brent only finds where a sequence repeats, in constant memory, by replaying it.
+detect also keeps the value of every step for extrapolation, so its memory grows until the cycle closes,
+keys can be a fingerprint of the state to keep that at 8 bytes per step for a grid or a long pattern.
+'''
+import hashlib
+from dataclasses import dataclass
+from itertools import count, islice
+from typing import Optional, Tuple
+
+end = object()
+
+
+def fingerprint(data: bytes) -> int:
+    '''64 bit hash of a state serialized to bytes, fits a uint64 array for checkpoints'''
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+
+
+@dataclass
+class Cycle:
+    mu: int      # step of the first state on the cycle
+    lam: int     # length of the cycle
+    values: list  # value of every step up to the first repeat, which is the last one
+
+    @property
+    def repeat(self):
+        '''value of the step whose key was seen before'''
+        return self.values[-1]
+
+    def at(self, n):
+        '''
+        Value at step n.
+
+        Values which change by the same amount every lap, like a sum of positions of a moving pattern,
+        are extrapolated linearly.
+        '''
+        if n < len(self.values):
+            return self.values[n]
+        laps, offset = divmod(n - self.mu, self.lam)
+        value = self.values[self.mu + offset]
+        first, again = self.values[self.mu], self.repeat
+        return value if first == again else value + laps * (again - first)
+
+
+class History:
+    '''
+    Keys seen so far with the step they were first seen at, along with the value of every step.
+
+    Both grow by one entry per step until the cycle closes, nothing is dropped.
+    '''
+    def __init__(self, keys=(), values=()):
+        self.index = dict(zip(keys, count()))
+        self.values = list(values)
+
+    @property
+    def keys(self):
+        return list(self.index)
+
+    def add(self, key, value) -> Optional[Cycle]:
+        '''record the next step, returns the cycle once a key repeats'''
+        self.values.append(value)
+        if key in self.index:
+            mu = self.index[key]
+            return Cycle(mu, len(self.values) - 1 - mu, self.values)
+        self.index[key] = len(self.index)
+
+
+def brent(states, key=None) -> Optional[Tuple[int, int]]:
+    '''
+    Step of the first state on the cycle and the length of the cycle, None if the sequence ends first.
+
+    states returns a fresh iterator over the sequence each call, it is replayed three times instead of remembered.
+    The sequence has to repeat once a state does, like one state computed from the previous.
+    '''
+    key = key or (lambda state: state)
+    keys = map(key, states())
+    tortoise, hare = next(keys, end), next(keys, end)
+    if tortoise is end:
+        return None
+    power = lam = 1
+    while tortoise != hare:
+        if hare is end:
+            return None
+        if power == lam:
+            tortoise, power, lam = hare, power * 2, 0
+        hare = next(keys, end)
+        lam += 1
+    tortoise, hare = map(key, states()), map(key, states())
+    next(islice(hare, lam - 1, None))
+    mu = 0
+    while next(tortoise) != next(hare):
+        mu += 1
+    return mu, lam
+
+
+def detect(states, key=None, value=None) -> Optional[Cycle]:
+    '''
+    Find where an iterable of states starts repeating, None if it ends first.
+
+    key and value default to the state itself, the key has to identify a state for the cycle to be real.
+    '''
+    history = History()
+    for state in states:
+        cycle = history.add(key(state) if key else state, value(state) if value else state)
+        if cycle:
+            return cycle
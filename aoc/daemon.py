@@ -0,0 +1,92 @@
+'''
+Long-lived solver process reachable over a unix socket.
+
+Day modules and parsed inputs stay in memory between requests, a day is only reloaded when its file changes.
+Requests and responses are single json lines.
+'''
+import importlib
+import json
+import socket
+import socketserver
+import sys
+import time
+from pathlib import Path
+
+import aoc
+from aoc import answers
+
+address = Path('cache/aoc.sock')
+
+
+def part_name(part):
+    part = str(part)
+    return part if part.startswith('part_') else f'part_{part}'
+
+
+class Solver:
+    def __init__(self):
+        self.mtimes = {}
+
+    def module(self, day):
+        '''import a day, or reload it if the file changed since'''
+        name = f'day{day:02d}'
+        mtime = Path(f'{name}.py').stat().st_mtime
+        if name in sys.modules and self.mtimes.get(day) != mtime:
+            importlib.reload(sys.modules[name])
+        else:
+            importlib.import_module(name)
+        self.mtimes[day] = mtime
+        return sys.modules[name]
+
+    def preload(self):
+        for day in aoc.available_days():
+            try:
+                self.module(day)
+            except ImportError as e:
+                print(f'day {day} not preloaded: {e}')
+
+    def solve(self, day, part, use_cache=True):
+        self.module(day)
+        f = aoc.registry[day, part_name(part)].f
+        start = time.perf_counter()
+        result, cached = answers.solve(day, f, aoc.load_input(day), use_cache)
+        return {'result': answers.plain(result), 'cached': cached, 'elapsed': time.perf_counter() - start}
+
+
+class Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        '''anything failing, serializing the answer included, is sent back as an error'''
+        try:
+            request = json.loads(self.rfile.readline())
+            if request.get('command') == 'stop':
+                response = {'stopped': True}
+                self.server.stopping = True
+            else:
+                response = self.server.solver.solve(request['day'], request['part'], request.get('cache', True))
+            line = json.dumps(response)
+        except Exception as e:
+            line = json.dumps({'error': f'{type(e).__name__}: {e}'})
+        self.wfile.write(line.encode() + b'\n')
+
+
+def serve():
+    '''requests are handled one at a time, solvers are cpu bound anyway'''
+    address.parent.mkdir(parents=True, exist_ok=True)
+    address.unlink(missing_ok=True)
+    with socketserver.UnixStreamServer(str(address), Handler) as server:
+        server.solver = Solver()
+        server.solver.preload()
+        server.stopping = False
+        print(f'listening on {address}')
+        try:
+            while not server.stopping:
+                server.handle_request()
+        finally:
+            address.unlink(missing_ok=True)
+
+
+def request(**kwds):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(str(address))
+        s.sendall(json.dumps(kwds).encode() + b'\n')
+        return json.loads(s.makefile().readline())
@@ -0,0 +1,71 @@
+import click
+
+import aoc
+from aoc import generate, limits
+from aoc.bench import format_time
+
+
+def run_part(day, part, text):
+    '''runs in a child process, so a solver stuck on an input can be stopped'''
+    return aoc.parts(day)[part](aoc.Data(text))
+
+
+def run_reference(day, part, text):
+    '''runs in a child process, so a reference too slow for an input can be stopped'''
+    aoc.parts(day)
+    f, scale, real = aoc.references[day, part]
+    return f(aoc.Data(text))
+
+
+def inputs(day, scale, seeds, real):
+    for seed in range(seeds):
+        yield f'seed {seed}', lambda seed=seed: generate.generate(day, scale, seed)
+    if real:
+        yield 'real input', lambda: aoc.read_input(day)
+
+
+def compare(day, part, seeds=3, real=True, timeout=60):
+    '''
+    Solve generated and real inputs with a part and its reference, report the speedup.
+
+    Returns False unless they agree on every input, an input which could not be compared,
+    because it is missing or either of them failed or ran out of time, does not pass either.
+    The real input is only used when the reference registered it can solve it.
+    '''
+    aoc.parts(day)
+    _, scale, solves_real = aoc.references[day, part]
+    agree = True
+    for name, text in inputs(day, scale, seeds, real and solves_real):
+        label = f'day {day:2d}, {part.replace("_", " ")}, {name:<10}'
+        try:
+            text = text()
+        except Exception as e:
+            click.secho(f'{aoc.fail} {label} not compared, no input, {type(e).__name__}: {e}')
+            agree = False
+            continue
+        try:
+            result, elapsed = limits.run(run_part, day, part, text, timeout=timeout)
+        except Exception as e:
+            click.secho(f'{aoc.fail} {label} not compared, solver failed, {type(e).__name__}: {e}')
+            agree = False
+            continue
+        try:
+            expected, reference_elapsed = limits.run(run_reference, day, part, text, timeout=timeout)
+        except Exception as e:
+            click.secho(f'{aoc.fail} {label} {result}, not compared, reference failed, {type(e).__name__}: {e}')
+            agree = False
+            continue
+        times = f'{format_time(reference_elapsed)} -> {format_time(elapsed)}, {reference_elapsed / elapsed:.1f}x'
+        if result == expected:
+            click.secho(f'{aoc.ok} {label} {result}  ' + click.style(times, dim=True))
+        else:
+            click.secho(f'{aoc.fail} {label} {result}, reference {expected}  ' + click.style(times, dim=True))
+            agree = False
+    return agree
+
+
+def run(days, seeds=3, real=True, timeout=60):
+    for day in days:
+        aoc.parts(day)
+    pairs = sorted(key for key in aoc.references if key[0] in days)
+    return all([compare(day, part, seeds, real, timeout) for day, part in pairs])
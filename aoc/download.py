@@ -0,0 +1,115 @@
+import os
+import re
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
+
+import aoc
+
+year = 2018
+base_url = os.environ.get('AOC_URL', 'http://adventofcode.com')
+archive = Path('inputs.zip')
+
+
+def member(day):
+    return f'day{day:02d}.txt'
+
+
+def cookies():
+    try:
+        from config import cookies
+    except ImportError:
+        return {}  # a local stand-in doesn't need them
+    return cookies
+
+
+@lru_cache()
+def session(pool_size=16):
+    '''one pooled session with retries, shared by every download'''
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    s = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_maxsize=pool_size, max_retries=retry)
+    s.mount('http://', adapter)
+    s.mount('https://', adapter)
+    s.cookies.update(cookies())
+    return s
+
+
+def fetch(day):
+    r = session().get(f'{base_url}/{year}/day/{day}/input')
+    r.raise_for_status()
+    return r.text
+
+
+def archived(day):
+    if not archive.exists():
+        return None
+    with zipfile.ZipFile(archive) as z:
+        try:
+            return z.read(member(day)).decode()
+        except KeyError:
+            return None
+
+
+def store(texts):
+    with zipfile.ZipFile(archive, 'a', zipfile.ZIP_LZMA) as z:
+        for day, text in texts.items():
+            z.writestr(member(day), text)
+
+
+def missing(days):
+    names = set()
+    if archive.exists():
+        with zipfile.ZipFile(archive) as z:
+            names = set(z.namelist())
+    return [day for day in days if member(day) not in names and not aoc.input_file(day).exists()]
+
+
+def prefetch(days, jobs=8):
+    '''download every missing input concurrently, then add them to the archive in one go'''
+    import click
+    texts = {}
+    with ThreadPoolExecutor(jobs) as pool:
+        futures = {pool.submit(fetch, day): day for day in missing(days)}
+        for future in as_completed(futures):
+            day = futures[future]
+            try:
+                texts[day] = future.result()
+            except Exception as e:
+                click.secho(f'{aoc.fail} day {day}: {e}')
+            else:
+                click.secho(f'{aoc.ok} downloaded input for day {day}')
+    if texts:
+        store(texts)
+    return texts
+
+
+def serve(source, port=8018):
+    '''
+    Local stand-in for the puzzle input endpoint.
+
+    source maps a day to its input, or None for a 404.
+    '''
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class InputHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            match = re.fullmatch(r'/(\d+)/day/(\d+)/input', self.path)
+            text = source(int(match.group(2))) if match else None
+            if text is None:
+                self.send_error(404)
+                return
+            body = text.encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(('127.0.0.1', port), InputHandler)
+    print(f'serving inputs on http://127.0.0.1:{port}')
+    server.serve_forever()
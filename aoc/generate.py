@@ -0,0 +1,431 @@
+'''
+Seeded synthetic inputs in the format of each day, for stress benchmarks.
+
+Each generator takes a random.Random and a scale, the meaning of scale is noted per day.
+Inputs are built so the solvers terminate, which sometimes means a simpler structure than the real ones.
+'''
+import random
+from collections import deque
+from datetime import datetime, timedelta
+from string import ascii_lowercase, ascii_uppercase
+
+generators = {}
+
+
+def generator(day, scale):
+    def decorator(f):
+        generators[day] = f, scale
+        return f
+    return decorator
+
+
+def generate(day, scale=None, seed=0):
+    f, default = generators[day]
+    return f(random.Random(seed), default if scale is None else scale)
+
+
+@generator(1, 1000)
+def frequencies(rng, scale):
+    '''scale changes, summing to a small positive drift so a frequency always repeats'''
+    changes = [rng.choice([-1, 1]) * rng.randint(1, 20) for _ in range(scale - 1)]
+    changes.append(rng.randint(1, scale) - sum(changes))
+    return '\n'.join(f'{x:+d}' for x in changes)
+
+
+@generator(2, 250)
+def box_ids(rng, scale):
+    '''scale ids, two of them differ by one letter'''
+    ids = [''.join(rng.choices(ascii_lowercase, k=26)) for _ in range(scale)]
+    a, b = rng.sample(range(scale), 2)
+    i = rng.randrange(26)
+    ids[b] = ids[a][:i] + rng.choice(ascii_lowercase.replace(ids[a][i], '')) + ids[a][i + 1:]
+    return '\n'.join(ids)
+
+
+@generator(3, 1300)
+def claims(rng, scale):
+    '''scale claims on the 1000x1000 fabric, one of them is kept clear of the others in a corner'''
+    rects = []
+    while len(rects) < scale - 1:
+        w, h = rng.randint(5, 30), rng.randint(5, 30)
+        x, y = rng.randint(0, 1000 - w), rng.randint(0, 1000 - h)
+        if x >= 10 or y >= 10:
+            rects.append((x, y, w, h))
+    rects.insert(rng.randrange(scale), (0, 0, 5, 5))
+    return '\n'.join(f'#{n} @ {x},{y}: {w}x{h}' for n, (x, y, w, h) in enumerate(rects, 1))
+
+
+@generator(4, 1000)
+def guard_records(rng, scale):
+    '''scale shifts, shuffled like the real log'''
+    guards = rng.sample(range(10, 4000), max(2, scale // 20))
+    start = datetime(1518, 1, 1)
+    lines = []
+    for night in range(scale):
+        date = start + timedelta(days=night)
+        shift = date + timedelta(minutes=rng.randint(-10, 5))
+        lines.append(f'[{shift:%Y-%m-%d %H:%M}] Guard #{rng.choice(guards)} begins shift')
+        minutes = sorted(rng.sample(range(1, 60), 2 * rng.randint(0, 3)))
+        for asleep, awake in zip(minutes[::2], minutes[1::2]):
+            lines.append(f'[{date + timedelta(minutes=asleep):%Y-%m-%d %H:%M}] falls asleep')
+            lines.append(f'[{date + timedelta(minutes=awake):%Y-%m-%d %H:%M}] wakes up')
+    rng.shuffle(lines)
+    return '\n'.join(lines)
+
+
+@generator(5, 50000)
+def polymer(rng, scale):
+    '''scale units'''
+    return ''.join(rng.choice([x, x.upper()]) for x in rng.choices(ascii_lowercase, k=scale))
+
+
+@generator(6, 50)
+def coordinates(rng, scale):
+    '''scale coordinates'''
+    return '\n'.join(f'{rng.randint(0, 400)}, {rng.randint(0, 400)}' for _ in range(scale))
+
+
+@generator(7, 100)
+def instructions(rng, scale):
+    '''scale requirements between the 26 steps, capped at 325'''
+    order = rng.sample(ascii_uppercase, 26)
+    pairs = [(a, b) for i, a in enumerate(order) for b in order[i + 1:]]
+    return '\n'.join(
+        f'Step {a} must be finished before step {b} can begin.'
+        for a, b in rng.sample(pairs, min(scale, len(pairs)))
+    )
+
+
+@generator(8, 2000)
+def license_tree(rng, scale):
+    '''about scale nodes, at most 30 deep to stay within the recursion limit'''
+    budget = [scale - 1]
+
+    def node(depth):
+        children = min(rng.randint(1 if depth < 3 else 0, 4) if depth < 30 else 0, budget[0])
+        budget[0] -= children
+        metadata = rng.randint(1, 3)
+        numbers = [children, metadata]
+        for _ in range(children):
+            numbers.extend(node(depth + 1))
+        numbers.extend(rng.randint(1, 4) for _ in range(metadata))
+        return numbers
+
+    return ' '.join(map(str, node(0)))
+
+
+@generator(9, 70000)
+def marbles(rng, scale):
+    '''scale is the last marble'''
+    return f'{rng.randint(10, 500)} players; last marble is worth {scale} points'
+
+
+@generator(10, 10000)
+def stars(rng, scale):
+    '''points which align into letters after scale seconds'''
+    targets = []
+    for letter in range(rng.randint(3, 8)):
+        left = letter * 8
+        targets += [(left, y) for y in range(10)] + [(left + 5, y) for y in range(10)]
+        targets += [(x, 4) for x in range(left + 1, left + 5)]
+    lines = []
+    for x, y in targets:
+        vx, vy = rng.randint(-5, 5), rng.randint(-5, 5)
+        lines.append(f'position=<{x - vx * scale:6d}, {y - vy * scale:6d}> velocity=<{vx:2d}, {vy:2d}>')
+    rng.shuffle(lines)
+    return '\n'.join(lines)
+
+
+@generator(11, 1)
+def serial(rng, scale):
+    '''the grid has a fixed size, scale is ignored'''
+    return str(rng.randint(1, 9999))
+
+
+@generator(12, 100)
+def pots(rng, scale):
+    '''
+    scale pots initially
+
+    random rules rarely settle into a steady state, so the notes shift every plant to the right
+    '''
+    state = ''.join(rng.choice('.#') for _ in range(scale))
+    notes = []
+    for n in range(32):
+        rule = ''.join('#' if n >> i & 1 else '.' for i in range(5))
+        notes.append(f'{rule} => {rule[1]}')
+    rng.shuffle(notes)
+    return f'initial state: {state}\n\n' + '\n'.join(notes)
+
+
+@generator(13, 40)
+def tracks(rng, scale):
+    '''
+    scale crossing loops with pairs of carts about to collide, and one lone cart on its own loop
+
+    the lone cart is the last one left for part 2
+    '''
+    size = 4 * scale
+    xs, ys = rng.sample(range(size), 2 * scale), rng.sample(range(size), 2 * scale)
+    rects = [(*sorted(xs[i:i + 2]), *sorted(ys[i:i + 2])) for i in range(0, 2 * scale, 2)]
+    rects.append((size + 1, size + 5, 0, 4))
+    grid = [[' '] * (size + 6) for _ in range(size)]
+    for l, r, t, b in rects:
+        for x in range(l + 1, r):
+            for y in t, b:
+                grid[y][x] = '+' if grid[y][x] == '|' else '-'
+        for y in range(t + 1, b):
+            for x in l, r:
+                grid[y][x] = '+' if grid[y][x] == '-' else '|'
+        grid[t][l], grid[t][r], grid[b][l], grid[b][r] = '/', '\\', '\\', '/'
+    free = [
+        (x, y) for y, row in enumerate(grid) for x, c in enumerate(row[:size])
+        if c == '-' and row[x + 1] == '-'
+    ]
+    for x, y in rng.sample(free, min(len(free), scale)):
+        if grid[y][x] == '-' and grid[y][x + 1] == '-':
+            grid[y][x], grid[y][x + 1] = '>', '<'
+    grid[0][size + 2] = '>'
+    return '\n'.join(''.join(row) for row in grid)
+
+
+@generator(14, 1000000)
+def recipes(rng, scale):
+    '''a number up to scale, its digits are the sequence for part 2'''
+    return str(rng.randint(scale // 2, scale)).zfill(len(str(scale)))
+
+
+@generator(15, 32)
+def cave(rng, scale):
+    '''scale x scale cave, every open square is reachable and about scale / 4 units roam it'''
+    grid = [
+        ['#' if x in (0, scale - 1) or y in (0, scale - 1) or rng.random() < 0.15 else '.' for x in range(scale)]
+        for y in range(scale)
+    ]
+    open_squares = [(x, y) for y, row in enumerate(grid) for x, c in enumerate(row) if c == '.']
+    start = rng.choice(open_squares)
+    reachable = {start}
+    frontier = deque([start])
+    while frontier:
+        x, y = frontier.popleft()
+        for n in (x, y - 1), (x - 1, y), (x + 1, y), (x, y + 1):
+            if grid[n[1]][n[0]] == '.' and n not in reachable:
+                reachable.add(n)
+                frontier.append(n)
+    for x, y in open_squares:
+        if (x, y) not in reachable:
+            grid[y][x] = '#'
+    units = rng.sample(sorted(reachable), min(len(reachable), max(2, scale // 4 + 20)))
+    for i, (x, y) in enumerate(units):
+        grid[y][x] = 'EG'[i % 2]
+    return '\n'.join(''.join(row) for row in grid)
+
+
+@generator(16, 800)
+def samples(rng, scale):
+    '''scale samples followed by a program of scale instructions'''
+    from day16 import opcodes
+    numbers = rng.sample(range(16), 16)
+    blocks = []
+    for _ in range(scale):
+        op = rng.randrange(16)
+        before = [rng.randint(0, 3) for _ in range(4)]
+        a, b, c = (rng.randint(0, 3) for _ in range(3))
+        after = before.copy()
+        after[c] = opcodes[op](before, a, b)
+        blocks.append(f'Before: {before}\n{numbers[op]} {a} {b} {c}\nAfter:  {after}')
+    program = '\n'.join(' '.join(str(rng.randint(0, 3) if i else rng.randrange(16)) for i in range(4)) for _ in range(scale))
+    return '\n\n'.join(blocks) + '\n\n\n\n' + program
+
+
+@generator(17, 1300)
+def veins(rng, scale):
+    '''about scale veins, made of buckets with a floor and two walls'''
+    lines = []
+    spread = max(50, scale // 2)
+    for _ in range(max(1, scale // 3)):
+        left = rng.randint(500 - spread, 500 + spread)
+        right = left + rng.randint(2, 20)
+        bottom = rng.randint(15, 15 + 2 * spread)
+        top = bottom - rng.randint(3, 14)
+        lines += [f'x={left}, y={top}..{bottom}', f'x={right}, y={top}..{bottom}', f'y={bottom}, x={left}..{right}']
+    rng.shuffle(lines)
+    return '\n'.join(lines)
+
+
+@generator(18, 50)
+def lumber(rng, scale):
+    '''scale x scale acres'''
+    return '\n'.join(''.join(rng.choices('.|#', k=scale)) for _ in range(scale))
+
+
+@generator(19, 900)
+def divisor_program(rng, scale):
+    '''program summing divisors of a number around scale, or around scale squared with r0 = 1'''
+    small = rng.randint(max(2, scale // 2), max(2, scale))
+    big = small * small
+    return f'''#ip 3
+addi 3 16 3
+seti 1 0 4
+seti 1 0 1
+mulr 4 1 2
+eqrr 2 5 2
+addr 2 3 3
+addi 3 1 3
+addr 4 0 0
+addi 1 1 1
+gtrr 1 5 2
+addr 3 2 3
+seti 2 0 3
+addi 4 1 4
+gtrr 4 5 2
+addr 2 3 3
+seti 1 0 3
+mulr 3 3 3
+seti {small} 0 5
+addr 3 0 3
+seti 0 0 3
+seti {big} 0 5
+seti 0 0 0
+seti 0 0 3'''
+
+
+@generator(20, 300)
+def route(rng, scale):
+    '''scale branches, nested at most 40 deep'''
+    budget = [scale]
+
+    def path(depth, extend):
+        parts = []
+        while budget[0] > 0 and (depth == 0 or rng.random() < extend):
+            parts.append(''.join(rng.choices('NESW', k=rng.randint(1, 5))))
+            if depth < 40 and rng.random() < 0.5:
+                budget[0] -= 1
+                options = [path(depth + 1, 0.5) for _ in range(rng.randint(2, 3))]
+                if rng.random() < 0.2:
+                    options.append('')
+                parts.append('(' + '|'.join(options) + ')')
+        return ''.join(parts)
+
+    return f'^{path(0, 1)}$'
+
+
+@generator(21, 24)
+def activation_program(rng, scale):
+    '''
+    the program has a fixed shape, only its seed changes, scale is the bits of the hashed value.
+
+    the real inputs use 24, fewer bits make the values repeat sooner, so a plain vm finds part 2 in time.
+    '''
+    seed = rng.randint(1, 2 ** scale - 1)
+    return f'''#ip 1
+seti 123 0 4
+bani 4 456 4
+eqri 4 72 4
+addr 4 1 1
+seti 0 0 1
+seti 0 2 4
+bori 4 65536 3
+seti {seed} 9 4
+bani 3 255 2
+addr 4 2 4
+bani 4 {2 ** scale - 1} 4
+muli 4 65899 4
+bani 4 {2 ** scale - 1} 4
+gtir 256 3 2
+addr 2 1 1
+addi 1 1 1
+seti 27 3 1
+seti 0 9 2
+addi 2 1 5
+muli 5 256 5
+gtrr 5 3 5
+addr 5 1 1
+addi 1 1 1
+seti 25 1 1
+addi 2 1 2
+seti 17 8 1
+setr 2 4 3
+seti 7 4 1
+eqrr 4 0 2
+addr 2 1 1
+seti 5 3 1'''
+
+
+@generator(22, 700)
+def cave_survey(rng, scale):
+    '''target scale deep'''
+    depth = rng.randint(3000, 12000)
+    # the mouth and the target have the region type of depth % 3, it can't be wet or the torch is unusable there
+    depth += depth % 3 == 1
+    return f'depth: {depth}\ntarget: {rng.randint(5, max(5, scale // 50))},{scale}'
+
+
+@generator(23, 1000)
+def nanobots(rng, scale):
+    '''
+    scale nanobots
+
+    like the real inputs, most of them reach a common point, so they overlap one another in one big clique.
+    the rest are small and far out, with only a few overlaps, so the clique search of part 2 stays fast.
+    uniform bots overlap densely but not completely, which makes it blow up.
+    '''
+    spread = 10 ** 8
+    center = [rng.randint(-spread // 2, spread // 2) for _ in range(3)]
+    bots = []
+    for i in range(scale):
+        if i % 10:
+            offset = [rng.randint(-spread // 3, spread // 3) for _ in range(3)]
+            pos = [c + o for c, o in zip(center, offset)]
+            r = sum(map(abs, offset)) + rng.randint(1, spread // 2)
+        else:
+            pos = [rng.randint(-10 * spread, 10 * spread) for _ in range(3)]
+            r = rng.randint(1, spread // 100)
+        bots.append(f'pos=<{pos[0]},{pos[1]},{pos[2]}>, r={r}')
+    rng.shuffle(bots)
+    return '\n'.join(bots)
+
+
+@generator(24, 10)
+def armies(rng, scale):
+    '''
+    scale groups per army
+
+    every unit deals more damage than any unit has hit points and nobody is immune to the other army,
+    so each round kills something and fights never stall. the immune system always strikes first,
+    so a large enough boost wipes out every infection group in the first round.
+    infection groups are much larger, so that boost is needed.
+    '''
+    units = {'Immune System': (100, 500), 'Infection': (2000, 5000)}
+    kinds = {'Immune System': ['fire', 'cold', 'slashing'], 'Infection': ['bludgeoning', 'radiation']}
+    initiatives = {
+        'Immune System': rng.sample(range(scale + 1, 2 * scale + 1), scale),
+        'Infection': rng.sample(range(1, scale + 1), scale),
+    }
+    blocks = []
+    for army, own in kinds.items():
+        enemy = [x for kind in kinds.values() if kind is not own for x in kind]
+        lines = [f'{army}:']
+        for initiative in initiatives[army]:
+            specials = []
+            weak = rng.sample(enemy, rng.randint(0, 1))
+            immune = rng.sample(own, rng.randint(0, 1))
+            if weak:
+                specials.append(f'weak to {", ".join(weak)}')
+            if immune:
+                specials.append(f'immune to {", ".join(immune)}')
+            specials = f'({"; ".join(specials)}) ' if specials else ''
+            lines.append(
+                f'{rng.randint(*units[army])} units each with {rng.randint(10, 50)} hit points {specials}'
+                f'with an attack that does {rng.randint(50, 100)} {rng.choice(own)} damage '
+                f'at initiative {initiative}'
+            )
+        blocks.append('\n'.join(lines))
+    return '\n\n'.join(blocks)
+
+
+@generator(25, 1000)
+def fixed_points(rng, scale):
+    '''scale points, spread wider as there are more of them'''
+    spread = max(8, round(3 * scale ** 0.25))
+    return '\n'.join(','.join(str(rng.randint(-spread, spread)) for _ in range(4)) for _ in range(scale))
@@ -0,0 +1,61 @@
+from operator import itemgetter
+
+
+class Point(tuple):
+    '''
+    Grid coordinate stored as (y, x), so points sort in reading order.
+
+    Being a tuple, hashing and comparison run in C instead of going through python methods.
+    Packing into a single int would need a known width, and several days grow in every direction.
+    '''
+    __slots__ = ()
+
+    def __new__(cls, x=0, y=0):
+        return tuple.__new__(cls, (y, x))
+
+    def __getnewargs__(self):
+        return self[1], self[0]
+
+    x = property(itemgetter(1))
+    y = property(itemgetter(0))
+
+    def __add__(self, other):
+        '''only points add up, a plain (x, y) tuple would have its axes swapped'''
+        if type(other) is not Point:
+            raise TypeError(f'can only add a Point to a Point, not {type(other).__name__}')
+        return tuple.__new__(Point, (self[0] + other[0], self[1] + other[1]))
+
+    __radd__ = __add__
+
+    def __repr__(self):
+        return f'Point({self[1]}, {self[0]})'
+
+    @property
+    def above(self):
+        return tuple.__new__(Point, (self[0] - 1, self[1]))
+
+    @property
+    def below(self):
+        return tuple.__new__(Point, (self[0] + 1, self[1]))
+
+    @property
+    def left(self):
+        return tuple.__new__(Point, (self[0], self[1] - 1))
+
+    @property
+    def right(self):
+        return tuple.__new__(Point, (self[0], self[1] + 1))
+
+    @property
+    def near(self):
+        '''orthogonal neighbours in reading order'''
+        y, x = self
+        return [
+            tuple.__new__(Point, (y - 1, x)),
+            tuple.__new__(Point, (y, x - 1)),
+            tuple.__new__(Point, (y, x + 1)),
+            tuple.__new__(Point, (y + 1, x)),
+        ]
+
+
+up, left, right, down = offsets = Point(0, -1), Point(-1, 0), Point(1, 0), Point(0, 1)
@@ -0,0 +1,137 @@
+import os
+import time
+from dataclasses import dataclass
+from functools import partial
+from inspect import cleandoc
+
+import click
+
+import aoc
+from aoc import answers, checkpoint, limits, memory, metrics, profiling, ok, fail
+from aoc.bench import format_time
+
+# examples are quick, one running longer than this is most likely stuck
+example_timeout = float(os.environ.get('AOC_EXAMPLE_TIMEOUT', 10))
+
+
+@dataclass
+class Options:
+    '''how real inputs are solved, from the command line of a day script or python -m aoc test'''
+    use_cache: bool = True
+    profile: bool = False
+    trace: bool = False
+    budget: float = 0
+
+
+def command_options(f):
+    '''options shared by day scripts and python -m aoc test'''
+    options = [
+        click.option('--no-cache', is_flag=True, help='recompute answers even if they are stored'),
+        click.option('--no-checkpoint', is_flag=True, help='start long loops over instead of resuming them'),
+        click.option('--profile', is_flag=True, envvar='AOC_PROFILE', help='profile real inputs'),
+        click.option('--memory', 'trace', is_flag=True, envvar='AOC_MEMORY', help='trace allocations, report peak memory and top sites'),
+        click.option('--budget', type=float, default=0, envvar='AOC_MEMORY_BUDGET', help='fail parts peaking over this many MB'),
+    ]
+    for option in reversed(options):
+        f = option(f)
+    return f
+
+
+def configure(no_cache, no_checkpoint, profile, trace, budget):
+    checkpoint.enabled = not no_checkpoint
+    return Options(not no_cache, profile, trace, budget)
+
+
+def main(solvers):
+    '''command line of a day run as a script, exits with an error when a part fails'''
+    @click.command()
+    @command_options
+    def command(**flags):
+        if not run(solvers, options=configure(**flags)):
+            raise SystemExit(1)
+
+    command()
+
+
+def run_case(day, part, case):
+    '''runs in a child process, which imports the day as a regular module'''
+    return aoc.parts(day)[part](aoc.Data(case))
+
+
+def solve_input(day, part, use_cache):
+    '''runs in a child process when the part has limits'''
+    result, cached = answers.solve(day, aoc.parts(day)[part], aoc.load_input(day), use_cache)
+    return result, cached, metrics.snapshot()
+
+
+def outcomes(solver, jobs=None):
+    '''example, expected answer and a callable returning the result with its elapsed time, in order of completion'''
+    cases = {cleandoc(case): expected for case, expected in solver.cases.items()}
+    timeout = solver.timeout or example_timeout
+    calls = {
+        case: partial(limits.Limited, run_case, solver.day, solver.part, case, timeout=timeout, memory=solver.memory)
+        for case in cases
+    }
+    for case, call in limits.as_completed(calls, jobs):
+        yield case, cases[case], call.outcome
+
+
+def check_examples(solver, jobs=None):
+    '''run all examples concurrently, each under the limits of the part, stop at the first failure'''
+    for case, expected, outcome in outcomes(solver, jobs):
+        case_pretty = case.replace('\n', ', ')
+        try:
+            result, elapsed = outcome()
+        except Exception as e:
+            result, elapsed = f'{type(e).__name__}: {e}', None
+        took = click.style(f'  {format_time(elapsed)}' if elapsed is not None else '', dim=True)
+        if result == expected:
+            click.secho(f'{ok} {case_pretty} == {result}' + took)
+        else:
+            click.secho(f'{fail} {case_pretty} == {result}, expected {expected}' + took)
+            return False
+    return True
+
+
+def solve(solver, data, use_cache=True):
+    '''answer for the real input and whether it was cached, in a child process if the part has limits'''
+    if solver.timeout or solver.memory:
+        (result, cached, snapshot), elapsed = limits.run(
+            solve_input, solver.day, solver.part, use_cache, timeout=solver.timeout, memory=solver.memory)
+        metrics.counters.update(snapshot[0])
+        metrics.gauges.update(snapshot[1])
+        return result, cached
+    return answers.solve(solver.day, solver.f, data, use_cache)
+
+
+def check(solver, jobs=None, options=Options()):
+    '''examples first, the real input only runs once all of them pass'''
+    click.secho(f'day {solver.day}, {solver.part.replace("_", " ")}')
+    if not check_examples(solver, jobs):
+        click.secho('tests failed\n', fg='red')
+        return False
+    data = aoc.load_input(solver.day)
+    within = True
+    metrics.reset((solver.day, solver.part))
+    start = time.perf_counter()
+    try:
+        if options.profile:
+            result, cached = profiling.run(solver.day, solver.f, data), False
+        elif options.trace:
+            (result, within), cached = memory.run(solver.day, solver.f, data, options.budget, solver.memory), False
+        else:
+            result, cached = solve(solver, data, options.use_cache)
+    except (TimeoutError, MemoryError) as e:
+        click.secho(f'{fail} {type(e).__name__}: {e}\n', fg='red')
+        return False
+    took = format_time(time.perf_counter() - start)
+    click.secho(f'{result}' + click.style(' (cached)' * cached + f'  {took}', dim=True))
+    snapshot = metrics.snapshot()
+    if any(snapshot):
+        click.secho(metrics.format_final(*snapshot), dim=True)
+    click.echo()
+    return within
+
+
+def run(solvers, jobs=None, options=Options()):
+    return all([check(solver, jobs, options) for solver in solvers])
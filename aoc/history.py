@@ -0,0 +1,80 @@
+import json
+import platform
+import statistics
+import subprocess
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import click
+
+import aoc
+from aoc.bench import format_time
+
+path = Path('cache/bench/history.jsonl')
+
+
+def commit():
+    try:
+        out = subprocess.run(['git', 'describe', '--always', '--dirty'], capture_output=True, text=True)
+    except FileNotFoundError:
+        return None
+    return out.stdout.strip() or None
+
+
+def environment():
+    return {
+        'commit': commit(),
+        'python': platform.python_version(),
+        'machine': f'{platform.node()}/{platform.machine()}',
+    }
+
+
+def record(results):
+    '''append a benchmark run, one line per part'''
+    run = {'run': time.strftime('%Y-%m-%dT%H:%M:%S'), **environment()}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open('a') as f:
+        for stats in results:
+            entry = {key: stats[key] for key in ['day', 'part', 'input', 'min', 'median', 'p95', 'peak_rss']}
+            f.write(json.dumps({**run, **entry}) + '\n')
+
+
+def load():
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text().splitlines() if line]
+
+
+def comparable(entry):
+    '''timings are only compared on the same machine, python, input hash and scale'''
+    inputs = entry['input']
+    digest = inputs.get('digest') or json.dumps(inputs, sort_keys=True)  # runs recorded before the hash
+    return entry['day'], entry['part'], entry['machine'], entry['python'], digest, inputs['scale'] or 0, inputs.get('stream', False)
+
+
+def compare(threshold=0.1, window=5):
+    '''
+    Compare the latest run of each part to the median of its previous runs.
+
+    Returns the parts slower than the baseline by more than the threshold.
+    '''
+    series = defaultdict(list)
+    for entry in load():
+        series[comparable(entry)].append(entry)
+    regressions = []
+    for key, entries in sorted(series.items()):
+        *previous, latest = entries
+        name = f'day {latest["day"]:2d}, {latest["part"].replace("_", " "):<8}'
+        if not previous:
+            click.secho(f'  {name} {format_time(latest["median"]):>10}  no baseline', dim=True)
+            continue
+        baseline = statistics.median(x['median'] for x in previous[-window:])
+        change = latest['median'] / baseline - 1
+        line = f'{name} {format_time(latest["median"]):>10}  baseline {format_time(baseline):>10}  {change:+7.1%}'
+        if change > threshold:
+            regressions.append(latest)
+            click.secho(f'{aoc.fail} {line}  at {latest["commit"]}')
+        else:
+            click.secho(f'{aoc.ok} {line}')
+    return regressions
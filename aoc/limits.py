@@ -0,0 +1,82 @@
+import multiprocessing
+import resource
+import time
+from multiprocessing.connection import wait
+
+
+def child(conn, target, args, memory):
+    if memory:
+        limit = int(memory * 2**20)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    start = time.perf_counter()
+    try:
+        conn.send((True, target(*args), time.perf_counter() - start))
+    except Exception as e:
+        conn.send((False, e, time.perf_counter() - start))
+
+
+class Limited:
+    '''
+    A call running in a child process, with its address space capped at memory MB.
+
+    A solver stuck in a loop can only be stopped by killing the process it runs in.
+    '''
+    def __init__(self, target, *args, timeout=None, memory=None):
+        self.conn, child_conn = multiprocessing.Pipe(duplex=False)
+        self.process = multiprocessing.Process(target=child, args=(child_conn, target, args, memory), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self.timeout = timeout
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+
+    def outcome(self):
+        '''result and elapsed time, raises what the call raised'''
+        if not self.conn.poll(0):
+            self.kill()
+            raise TimeoutError(f'timed out after {self.timeout:g}s')
+        try:
+            ok, value, elapsed = self.conn.recv()
+        except EOFError:
+            self.process.join()
+            raise RuntimeError(f'worker died with exit code {self.process.exitcode}') from None
+        self.process.join()
+        if not ok:
+            raise value
+        return value, elapsed
+
+
+def run(target, *args, timeout=None, memory=None):
+    call = Limited(target, *args, timeout=timeout, memory=memory)
+    wait([call.conn], timeout)
+    return call.outcome()
+
+
+def as_completed(factories, jobs=None):
+    '''
+    Start calls from a dict of factories, at most jobs at a time, and yield key and call as they finish or time out.
+
+    Calls still running are killed when the generator is closed.
+    '''
+    pending = list(factories.items())
+    jobs = jobs or multiprocessing.cpu_count()
+    running = {}
+    try:
+        while pending or running:
+            while pending and len(running) < jobs:
+                key, factory = pending.pop(0)
+                running[key] = factory()
+            deadlines = [call.deadline for call in running.values() if call.deadline is not None]
+            timeout = max(min(deadlines) - time.monotonic(), 0) if deadlines else None
+            ready = wait([call.conn for call in running.values()], timeout)
+            now = time.monotonic()
+            for key, call in list(running.items()):
+                if call.conn in ready or (call.deadline is not None and call.deadline <= now):
+                    del running[key]
+                    yield key, call
+    finally:
+        for call in running.values():
+            call.kill()
@@ -0,0 +1,74 @@
+import os
+import threading
+import tracemalloc
+
+top = int(os.environ.get('AOC_MEMORY_TOP', 10))
+
+
+def format_size(size):
+    for unit in ['B', 'kB', 'MB']:
+        if abs(size) < 1024:
+            return f'{size:.1f} {unit}'
+        size /= 1024
+    return f'{size:.1f} GB'
+
+
+class PeakSnapshot(threading.Thread):
+    '''
+    Snapshot traced memory whenever it grows past the largest snapshot.
+
+    Whatever a solver allocated is mostly freed by the time it returns, so sites are taken close to the peak.
+    '''
+    def __init__(self, interval=0.05, growth=1.1):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.growth = growth
+        self.size = 0
+        self.snapshot = None
+        self.done = threading.Event()
+
+    def take(self):
+        size, peak = tracemalloc.get_traced_memory()
+        if size > self.size * self.growth or self.snapshot is None:
+            self.size, self.snapshot = size, tracemalloc.take_snapshot()
+
+    def run(self):
+        while not self.done.wait(self.interval):
+            self.take()
+
+    def stop(self):
+        self.done.set()
+        self.join()
+        self.take()
+
+
+def run(day, f, data, budget=None, limit=None):
+    '''
+    Trace allocations of a solver, print the peak and the top sites.
+
+    The peak is checked against the budget of every part in MB, or the limit of this one when there is none.
+    '''
+    import click
+    sampler = PeakSnapshot()
+    tracemalloc.start()
+    sampler.start()
+    try:
+        result = f(data)
+    finally:
+        sampler.stop()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    snapshot = sampler.snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, threading.__file__),
+        tracemalloc.Filter(False, __file__),
+    ])
+    click.secho(f'peak {format_size(peak)}, top sites at {format_size(sampler.size)}:', dim=True)
+    for stat in snapshot.statistics('lineno')[:top]:
+        frame = stat.traceback[0]
+        click.secho(f'{format_size(stat.size):>10} {stat.count:>9} blocks  {frame.filename}:{frame.lineno}', dim=True)
+    allowed = budget or limit
+    within = not allowed or peak <= allowed * 2**20
+    if not within:
+        click.secho(f'day {day} {f.__name__} peaked at {format_size(peak)}, over the {allowed:g} MB budget', fg='red')
+    return result, within
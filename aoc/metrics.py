@@ -0,0 +1,58 @@
+import threading
+import time
+from collections import Counter
+
+# cheap enough to bump in hot loops, a worker publishes them for the runner to show
+counters = Counter()
+gauges = {}
+job = None
+
+# hot loops like the day 19 and 21 interpreters count locally and flush every block steps,
+# a counter update per step is too slow
+block = 100_000
+
+
+def count(name, n=1):
+    counters[name] += n
+
+
+def gauge(name, value):
+    gauges[name] = value
+
+
+def reset(current=None):
+    global job
+    job = current
+    counters.clear()
+    gauges.clear()
+
+
+def snapshot():
+    return dict(counters), dict(gauges)
+
+
+def publish(queue, interval=0.5):
+    '''worker initializer, sends the running job and its metrics to the runner periodically'''
+    def loop():
+        while True:
+            time.sleep(interval)
+            if job is not None:
+                queue.put((job, time.monotonic(), *snapshot()))
+
+    threading.Thread(target=loop, daemon=True).start()
+
+
+def format_number(n):
+    for unit in ['', 'k', 'M', 'G']:
+        if abs(n) < 1000:
+            return f'{n:.3g}{unit}'
+        n /= 1000
+    return f'{n:.3g}T'
+
+
+def format_rates(before, after, elapsed):
+    return '  '.join(f'{name} {format_number((n - before.get(name, 0)) / elapsed)}/s' for name, n in after.items())
+
+
+def format_final(counters, gauges):
+    return '  '.join(f'{name} {value:,}' for name, value in {**counters, **gauges}.items())
@@ -0,0 +1,73 @@
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+root = Path('profiles')
+top = int(os.environ.get('AOC_PROFILE_TOP', 20))
+
+
+def label(func):
+    filename, lineno, name = func
+    if filename == '~':
+        return name
+    return f'{Path(filename).name}:{lineno}({name})'
+
+
+class Sampler(threading.Thread):
+    '''
+    Flamegraph input sampled from a running solver.
+
+    cProfile only records caller-callee edges, so real stacks of the profiled thread are read
+    every few milliseconds instead, each weighted by the time since the previous sample.
+    '''
+    def __init__(self, f, interval=0.002):
+        super().__init__(daemon=True)
+        self.code = f.__code__
+        self.thread = threading.get_ident()
+        self.interval = interval
+        self.stacks = defaultdict(float)
+        self.stopped = threading.Event()
+
+    def run(self):
+        last = time.perf_counter()
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread)
+            stack = []
+            while frame is not None:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            now = time.perf_counter()
+            if self.code in stack:
+                # frames above the outermost call of the solver belong to the harness
+                stack = stack[len(stack) - 1 - stack[::-1].index(self.code)::-1]
+                self.stacks[';'.join(label((c.co_filename, c.co_firstlineno, c.co_name)) for c in stack)] += now - last
+            last = now
+
+    def collapsed(self):
+        return [f'{stack} {round(t * 1e6)}' for stack, t in self.stacks.items() if round(t * 1e6)]
+
+
+def run(day, f, data):
+    '''profile a solver, save the .prof and collapsed stacks, print the hottest functions'''
+    import click
+    profiler = cProfile.Profile()
+    sampler = Sampler(f)
+    sampler.start()
+    try:
+        result = profiler.runcall(f, data)
+    finally:
+        sampler.stopped.set()
+        sampler.join()
+    root.mkdir(exist_ok=True)
+    name = root / f'day{day:02d}_{f.__name__}'
+    profiler.dump_stats(name.with_suffix('.prof'))
+    stats = pstats.Stats(profiler)
+    name.with_suffix('.folded').write_text('\n'.join(sampler.collapsed()) + '\n')
+    stats.sort_stats('cumulative').print_stats(top)
+    click.secho(f'profile saved to {name}.prof, collapsed stacks to {name}.folded', dim=True)
+    return result
@@ -0,0 +1,108 @@
+import json
+import multiprocessing
+import queue
+import shutil
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+import click
+
+import aoc
+from aoc import answers, download, metrics
+from aoc.bench import format_time
+
+# known multi-minute parts, used when there are no benchmarks to go by
+slowest = [(15, 'part_2'), (18, 'part_2'), (24, 'part_2'), (14, 'part_2'), (15, 'part_1'), (11, 'part_2')]
+
+
+def expected_times(path='bench.json'):
+    try:
+        return {(x['day'], x['part']): x['median'] for x in json.loads(Path(path).read_text())}
+    except FileNotFoundError:
+        return {job: len(slowest) - i for i, job in enumerate(slowest)}
+
+
+def schedule(days):
+    '''all day/part jobs, longest first'''
+    times = expected_times()
+    jobs = [(day, part) for day in days for part in aoc.part_names(day)]
+    return sorted(jobs, key=lambda job: times.get(job, 0), reverse=True)
+
+
+def solve(day, part, use_cache=True, stream=False):
+    '''runs in a worker, so the day and its dependencies are only imported there'''
+    f = aoc.parts(day)[part]
+    data = aoc.stream_input(day) if stream and aoc.registry[day, part].stream else aoc.load_input(day)
+    metrics.reset((day, part))
+    start = time.perf_counter()
+    result, cached = answers.solve(day, f, data, use_cache)
+    elapsed = time.perf_counter() - start
+    snapshot = metrics.snapshot()
+    metrics.reset()
+    return result, cached, elapsed, snapshot
+
+
+class Progress:
+    '''live rates of the running jobs on one status line'''
+    def __init__(self, updates):
+        self.updates = updates
+        self.last = {}
+        self.rates = {}
+        self.live = sys.stdout.isatty()
+
+    def poll(self):
+        while True:
+            try:
+                job, now, counters, gauges = self.updates.get_nowait()
+            except queue.Empty:
+                break
+            if job in self.last:
+                then, before = self.last[job]
+                self.rates[job] = metrics.format_rates(before, counters, now - then)
+            self.last[job] = now, counters
+
+    def done(self, job):
+        self.last.pop(job, None)
+        self.rates.pop(job, None)
+
+    def clear(self):
+        if self.live:
+            click.echo('\r\x1b[K', nl=False)
+
+    def show(self):
+        if self.live and self.rates:
+            line = ' | '.join(f'day {day} {part.replace("_", " ")}: {rates}' for (day, part), rates in self.rates.items())
+            click.echo('\r\x1b[K' + click.style(line[:shutil.get_terminal_size().columns - 1], dim=True), nl=False)
+
+
+def run(days, jobs=None, use_cache=True, stream=False):
+    '''true when every part was solved'''
+    download.prefetch(days)
+    ok = True
+    updates = multiprocessing.Queue()
+    progress = Progress(updates)
+    with ProcessPoolExecutor(jobs, initializer=metrics.publish, initargs=(updates,)) as pool:
+        pending = {pool.submit(solve, day, part, use_cache, stream): (day, part) for day, part in schedule(days)}
+        futures = dict(pending)
+        while pending:
+            done, _ = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+            progress.poll()
+            progress.clear()
+            for future in done:
+                day, part = job = futures[future]
+                del pending[future]
+                progress.done(job)
+                name = f'day {day:2d}, {part.replace("_", " "):<8}'
+                try:
+                    result, cached, elapsed, snapshot = future.result()
+                except Exception as e:
+                    click.secho(f'{aoc.fail} {name} {type(e).__name__}: {e}')
+                    ok = False
+                    continue
+                click.secho(f'{aoc.ok} {name} {format_time(elapsed):>10}  {result}' + click.style(' (cached)' * cached, dim=True))
+                if any(snapshot):
+                    click.secho(f'  {metrics.format_final(*snapshot)}', dim=True)
+            progress.show()
+    return ok
@@ -0,0 +1,73 @@
+'''
+Shortest paths over implicit graphs, given a function listing the neighbours of a state.
+
+States only need to be hashable, packing them into ints keeps hashing and comparison cheap.
+'''
+import heapq
+from collections import deque
+from itertools import count
+
+
+def bfs(starts, neighbours, goal=None):
+    '''
+    Distances and parents from one or many starts, stopping once goal is reached.
+
+    A state keeps the first state which reached it, so ties go to the order in which neighbours are listed.
+    '''
+    dist = {start: 0 for start in starts}
+    parent = dict.fromkeys(starts)
+    frontier = deque(dist)
+    while frontier:
+        state = frontier.popleft()
+        if state == goal:
+            break
+        step = dist[state] + 1
+        for n in neighbours(state):
+            if n not in dist:
+                dist[n] = step
+                parent[n] = state
+                frontier.append(n)
+    return dist, parent
+
+
+def distances(starts, neighbours):
+    '''distance field from the nearest of the starts to every reachable state'''
+    return bfs(starts, neighbours)[0]
+
+
+def dijkstra(starts, neighbours, goal=None, heuristic=None):
+    '''
+    Distances and parents with weighted edges, neighbours yields (state, cost) pairs.
+
+    With a heuristic this is A*, which needs a goal to stop at. States are expanded lazily,
+    stale heap entries are skipped, and ties go to the state pushed first.
+    '''
+    dist = {start: 0 for start in starts}
+    parent = dict.fromkeys(starts)
+    order = count()
+    heap = [(heuristic(start) if heuristic else 0, next(order), start) for start in starts]
+    heapq.heapify(heap)
+    done = set()
+    while heap:
+        _, _, state = heapq.heappop(heap)
+        if state in done:
+            continue
+        done.add(state)
+        if state == goal:
+            break
+        for n, cost in neighbours(state):
+            d = dist[state] + cost
+            if n not in dist or d < dist[n]:
+                dist[n] = d
+                parent[n] = state
+                heapq.heappush(heap, (d + heuristic(n) if heuristic else d, next(order), n))
+    return dist, parent
+
+
+def path(parent, state):
+    '''states from a start to the given one'''
+    states = []
+    while state is not None:
+        states.append(state)
+        state = parent[state]
+    return states[::-1]
@@ -0,0 +1,49 @@
+import time
+import traceback
+from pathlib import Path
+
+import click
+
+import aoc
+from aoc import answers, daemon, harness
+
+
+def changed_parts(day, hashes):
+    '''parts whose code changed since they last ran'''
+    for (d, part), solver in sorted(aoc.registry.items()):
+        if d == day and hashes.get((day, part)) != answers.source_hash(solver.f):
+            yield solver
+
+
+def watch(days, interval=0.05):
+    '''
+    Rerun the parts of a day whose code changed whenever its file is saved.
+
+    Modules stay imported and inputs stay parsed between runs, examples run in children forked from this process.
+    '''
+    loader = daemon.Solver()
+    mtimes, hashes = {}, {}
+    for day in days:
+        mtimes[day] = Path(f'day{day:02d}.py').stat().st_mtime
+        try:
+            loader.module(day)
+        except Exception as e:
+            click.secho(f'day {day}: {type(e).__name__}: {e}', fg='red')
+            continue
+        for solver in changed_parts(day, hashes):
+            hashes[day, solver.part] = answers.source_hash(solver.f)
+    click.secho(f'watching {len(days)} days', dim=True)
+    while True:
+        time.sleep(interval)
+        for day in days:
+            mtime = Path(f'day{day:02d}.py').stat().st_mtime
+            if mtime == mtimes[day]:
+                continue
+            mtimes[day] = mtime
+            try:
+                loader.module(day)
+                for solver in changed_parts(day, hashes):
+                    harness.check(solver)
+                    hashes[day, solver.part] = answers.source_hash(solver.f)
+            except Exception:
+                traceback.print_exc()
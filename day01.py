@@ -1,5 +1,7 @@
-from itertools import cycle
+from itertools import accumulate, cycle
+
 import aoc
+from aoc import cycles
 
 
 @aoc.test({
@@ -7,7 +9,7 @@ import aoc
     '+1\n+1\n+1': 3,
     '+1\n+1\n-2': 0,
     '-1\n-2\n-3': -6,
-})
+}, stream=True)
 def part_1(data: aoc.Data):
     value = 0
     for adj in data.int_lines:
@@ -21,13 +23,7 @@ def part_1(data: aoc.Data):
     '+3\n+3\n+4\n-2\n-4': 10,
     '-6\n+3\n+8\n+5\n-6': 5,
     '+7\n+7\n-2\n-7\n-4': 14,
-})
+}, timeout=10)
 def part_2(data: aoc.Data):
-    value = 0
-    seen = {0}
-    for adj in cycle(data.int_lines):
-        value += adj
-        if value in seen:
-            break
-        seen.add(value)
-    return value
+    frequencies = accumulate(cycle(data.int_lines), initial=0)
+    return cycles.detect(frequencies).repeat
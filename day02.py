@@ -7,7 +7,7 @@ import aoc
 def part_1(data: aoc.Data):
     counts = Counter()
 
-    for line in data.splitlines():
+    for line in data.lines:
         line_counts = Counter()
         for a, v in Counter(line).items():
             line_counts[v] = 1
@@ -8,21 +8,23 @@ example = '''
     '''
 
 
-@aoc.test({example: 4})
-def part_1(data: aoc.Data):
-    rects = data.ints_lines
+@aoc.shared
+def claim_fabric(data):
     fabric = np.zeros((1000, 1000))
-    for n, x, y, w, h in rects:
+    for n, x, y, w, h in data.ints_lines:
         fabric[x:x+w, y:y+h] += 1
+    return aoc.frozen(fabric)
+
+
+@aoc.test({example: 4})
+def part_1(data: aoc.Data):
+    fabric = claim_fabric(data)
     return np.sum(fabric > 1)
 
 
 @aoc.test({example: 3})
 def part_2(data: aoc.Data):
-    rects = data.ints_lines
-    fabric = np.zeros((1000, 1000))
-    for n, x, y, w, h in rects:
-        fabric[x:x+w, y:y+h] += 1
-    for n, x, y, w, h in rects:
+    fabric = claim_fabric(data)
+    for n, x, y, w, h in data.ints_lines:
         if np.sum(fabric[x:x+w, y:y+h] > 1) == 0:
             return n
@@ -1,6 +1,5 @@
 import re
 import aoc
-import pendulum
 from collections import Counter
 
 example = '''
@@ -24,7 +23,9 @@ example = '''
     '''
 
 
+@aoc.shared
 def parse_guards(data):
+    import pendulum
     guards = {int(x) for x in re.findall(r'#(\d+)', data)}
     slept = Counter()
     minutes = {guard: Counter() for guard in guards}
@@ -46,7 +46,7 @@ class Worker:
     remaining: int = None
 
 
-@aoc.test({example: 15})
+@aoc.test({example: 15}, timeout=10)
 def part_2(data: aoc.Data):
     is_example = data == aoc.cleandoc(example)
     per_task = 1 if is_example else 61
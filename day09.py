@@ -27,6 +27,36 @@ def play_marbles(players, last):
     return max(hands.values())
 
 
+def scored_marbles(last):
+    '''points of every 23rd marble in turn order, they don't depend on the number of players'''
+    import numpy as np
+    marbles = deque([0])
+    scored = []
+    for marble in range(1, last + 1):
+        if not marble % 23:
+            marbles.rotate(7)
+            scored.append(marble + marbles.pop())
+            marbles.rotate(-1)
+        else:
+            marbles.rotate(-1)
+            marbles.append(marble)
+    return np.array(scored, dtype=np.int64)
+
+
+def high_scores(games):
+    '''play the longest game once and split its points between players of every game'''
+    import numpy as np
+    scored = scored_marbles(max(last for players, last in games))
+    turns = np.arange(1, len(scored) + 1) * 23
+    scores = []
+    for players, last in games:
+        n = last // 23
+        hands = np.zeros(players, dtype=np.int64)
+        np.add.at(hands, turns[:n] % players, scored[:n])
+        scores.append(int(hands.max()))
+    return scores
+
+
 @aoc.test(examples)
 def part_1(data: aoc.Data):
     players, last = data.ints_lines[0]
@@ -37,3 +67,13 @@ def part_1(data: aoc.Data):
 def part_2(data: aoc.Data):
     players, last = data.ints_lines[0]
     return play_marbles(players, last * 100)
+
+
+@aoc.batched('part_1')
+def batch_part_1(datas):
+    return high_scores([data.ints_lines[0] for data in datas])
+
+
+@aoc.batched('part_2')
+def batch_part_2(datas):
+    return high_scores([(players, last * 100) for players, last in (data.ints_lines[0] for data in datas)])
@@ -1,6 +1,5 @@
 from itertools import count
 import numpy as np
-from matplotlib.pyplot import imshow, show
 
 import aoc
 
@@ -70,6 +69,7 @@ def ocr(points):
 
 
 def render(points):
+    from matplotlib.pyplot import imshow, show
     canvas = as_array(points)
     imshow(canvas)
     show()
@@ -51,3 +51,49 @@ def part_2(data: aoc.Data):
             # exit early if no improvement
             break
     return f'{bx},{by},{bs}'
+
+
+def window_sums(serials):
+    '''summed-area tables of the grids of many serials at once'''
+    x, y = np.ogrid[:301, :301]
+    grids = cell_power(x, y, np.asarray(serials)[:, None, None])
+    sums = np.zeros((len(serials), 302, 302), dtype=np.int64)
+    sums[:, 1:, 1:] = grids.cumsum(1).cumsum(2)
+    return sums
+
+
+def best_squares(sums, s):
+    '''power and top left corner of the best square of size s for every serial'''
+    lo, hi = slice(1, 301 - s), slice(1 + s, 301)
+    power = sums[:, hi, hi] - sums[:, lo, hi] - sums[:, hi, lo] + sums[:, lo, lo]
+    flat = power.reshape(len(power), -1)
+    index = flat.argmax(1)
+    y, x = np.divmod(index, 300 - s)
+    return flat[np.arange(len(flat)), index], x + 1, y + 1
+
+
+@aoc.batched('part_1')
+def batch_part_1(datas):
+    sums = window_sums([int(data) for data in datas])
+    _, bx, by = best_squares(sums, 3)
+    return [f'{x},{y}' for x, y in zip(bx, by)]
+
+
+@aoc.batched('part_2')
+def batch_part_2(datas):
+    sums = window_sums([int(data) for data in datas])
+    n = len(datas)
+    best = np.full(n, np.iinfo(np.int64).min)
+    bx, by, bs = np.zeros((3, n), dtype=int)
+    active = np.ones(n, dtype=bool)
+    for s in range(1, 301):
+        power, x, y = best_squares(sums[active], s)
+        better = np.zeros(n, dtype=bool)
+        better[active] = power > best[active]
+        best[better] = power[better[active]]
+        bx[better], by[better], bs[better] = x[better[active]], y[better[active]], s
+        # same early exit as part_2, per serial
+        active &= s < bs + 5
+        if not active.any():
+            break
+    return [f'{x},{y},{s}' for x, y, s in zip(bx, by, bs)]
@@ -1,7 +1,6 @@
 from collections import defaultdict
-from itertools import count
-
 import aoc
+from aoc import cycles
 
 
 example = '''
@@ -30,6 +29,7 @@ def print_state(state):
 
 
 def grow(state, notes):
+    aoc.count('generations')
     new = defaultdict(lambda: '.')
     for note in notes:
         rule, result = note.split(' => ')
@@ -40,6 +40,18 @@ def grow(state, notes):
     return new
 
 
+def generations(state, notes):
+    while True:
+        yield state
+        state = grow(state, notes)
+
+
+def pattern(state):
+    '''plants without their position, the same pattern shifted along is the same state'''
+    plants = [x for x in state if state[x] == '#']
+    return ''.join(state.get(x, '.') for x in range(min(plants, default=0), max(plants, default=-1) + 1))
+
+
 def value(state):
     return sum(x for x in state if state[x] == '#')
 
@@ -57,11 +69,6 @@ def part_1(data: aoc.Data):
 def part_2(data: aoc.Data):
     state, _, *notes = data.splitlines()
     state = dict(enumerate(state.split(': ')[-1]))
-    values = [value(state)]
-    for gen in count(1):
-        state = grow(state, notes)
-        values.append(value(state))
-        diffs = [v2 - v1 for v1, v2 in zip(values, values[1:])]
-        if len(values) > 10 and len(set(diffs[-10:])) == 1:
-            # found a stable point
-            return (50000000000 - gen) * diffs[-1] + values[-1]
+    key = lambda state: cycles.fingerprint(pattern(state).encode())
+    cycle = cycles.detect(generations(state, notes), key=key, value=value)
+    return cycle.at(50_000_000_000)
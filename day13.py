@@ -1,8 +1,6 @@
 from collections import deque, defaultdict
 from itertools import cycle
 
-import click
-
 import aoc
 
 steps = {
@@ -62,6 +60,7 @@ class Car:
 
 
 def render(grid, cars):
+    import click
     msg = []
     car_coords = {(c.x, c.y): c for c in cars}
     for y, row in enumerate(grid):
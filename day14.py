@@ -29,12 +29,22 @@ def part_1(data: aoc.Data):
 def part_2(data: aoc.Data):
     data = data.rstrip()
     window = len(data) + 1
-    mop, lop = 0, 1
-    recipes = '37'
+    checkpoint = aoc.Checkpoint(part_2, data)
+    state = checkpoint.load()
+    if state:
+        recipes, mop, lop = state['recipes'].tobytes().decode(), int(state['mop']), int(state['lop'])
+    else:
+        recipes, mop, lop = '37', 0, 1
     while True:
-        combined = int(recipes[mop]) + int(recipes[lop])
-        recipes += str(combined)
-        mop = (mop + 1 + int(recipes[mop])) % len(recipes)
-        lop = (lop + 1 + int(recipes[lop])) % len(recipes)
-        if data in recipes[-window:]:
-            return recipes.index(data)
+        # time is only checked between blocks, the loop is too tight to do it every step
+        for _ in range(100_000):
+            combined = int(recipes[mop]) + int(recipes[lop])
+            recipes += str(combined)
+            mop = (mop + 1 + int(recipes[mop])) % len(recipes)
+            lop = (lop + 1 + int(recipes[lop])) % len(recipes)
+            if data in recipes[-window:]:
+                checkpoint.clear()
+                return recipes.index(data)
+        if checkpoint.due():
+            import numpy as np
+            checkpoint.save(recipes=np.frombuffer(recipes.encode(), np.uint8), mop=mop, lop=lop)
@@ -1,50 +1,35 @@
-from collections import deque
 from dataclasses import dataclass
 from itertools import chain, count
 from typing import List
 
-import numpy as np
-import pyglet
-from pyglet.gl import *
-from PIL import Image
-
 import aoc
+from aoc import search
+from aoc.geometry import Point
 
 
-window = pyglet.window.Window(800, 800, caption='aoc 2018 day 15')
+# spaces pad short rows
+symbols = ' .#EG'
+outside, open_cavern, wall, elf, goblin = range(len(symbols))
+window = None
 file_no = count()
 
 
-def reading_order(point):
-    return point.y, point.x
-
-
-def flat(it):
-    return list(chain.from_iterable(it))
+def gl_window():
+    '''the window is only opened once something is rendered'''
+    global window
+    if window is None:
+        import pyglet
+        window = pyglet.window.Window(800, 800, caption='aoc 2018 day 15')
+    return window
 
 
-@dataclass
-class Point:
-    x: int
-    y: int
+def reading_order(unit):
+    '''points sort in reading order by themselves'''
+    return unit.pos
 
-    def __add__(self, other):
-        return Point(self.x + other.x, self.y + other.y)
 
-    def __eq__(self, other):
-        return (self.x, self.y) == (other.x, other.y)
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    @property
-    def near(self):
-        return [
-            self + Point(0, -1),
-            self + Point(-1, 0),
-            self + Point(1, 0),
-            self + Point(0, 1),
-        ]
+def flat(it):
+    return list(chain.from_iterable(it))
 
 
 @dataclass
@@ -71,6 +56,22 @@ class Unit:
         return [x for x in others if self.foe(x) and x.alive]
 
 
+def positions(mask):
+    '''(y, x) of every true cell as plain ints'''
+    return zip(*(axis.tolist() for axis in mask.nonzero()))
+
+
+@aoc.shared
+def parse_cave(data: aoc.Data):
+    '''walls, starting units and size of the cave, read once for both parts and every attempt of part 2'''
+    cave = data.codes(symbols)
+    walls = frozenset(Point(x, y) for y, x in positions(cave == wall))
+    # nonzero goes row by row, so units come in reading order
+    units = [(Point(x, y), symbols[cave[y, x]]) for y, x in positions(cave >= elf)]
+    height, width = cave.shape
+    return walls, units, Point(width - 1, height - 1)
+
+
 @dataclass
 class Grid:
     walls: List[Point]
@@ -78,18 +79,10 @@ class Grid:
 
     @classmethod
     def from_string(cls, data):
-        if isinstance(data, str):
-            data = data.splitlines()
-        walls = set()
-        units = []  # units are mutable, so hashing is unsafe
-        for y, row in enumerate(data):
-            for x, symbol in enumerate(row):
-                if symbol == '#':
-                    walls.add(Point(x, y))
-                if symbol in 'EG':
-                    units.append(Unit(Point(x, y), symbol))
-        self = cls(walls, units)
-        self.dimensions = Point(x, y)
+        walls, units, dimensions = parse_cave(data)
+        # units are mutable, so every grid gets its own
+        self = cls(walls, [Unit(pos, symbol) for pos, symbol in units])
+        self.dimensions = dimensions
         self.update_passable_cache()
         return self
 
@@ -114,7 +107,7 @@ class Grid:
 
     def melee(self, unit: Unit):
         '''choose nearest unit with the lowest hp'''
-        targets = [x for x in unit.targets(self.alive_units) if x in unit.near]
+        targets = [x for x in unit.targets(self.alive_units) if x.pos in unit.near]
         try:
             fewest_hp = min(x.hp for x in targets)
         except ValueError:
@@ -135,29 +128,14 @@ class Grid:
             return True
 
     def breadth_search(self, start: Point, targets: List[Point]):
-        frontier = deque([(0, start)])  # dist, pos
-        visited = {start}
-        meta = {start: (0, None)}  # dist, came_from
-        while frontier:
-            dist, pos = frontier.popleft()
-            for n in self.passable(pos.near):
-                if n in visited:
-                    continue
-                if n not in meta or meta[n] > (dist + 1, pos):
-                    meta[n] = dist + 1, pos
-                visited.add(n)
-                frontier.append((dist + 1, n))
-
-        reachable = [(dist, pos) for pos, (dist, _) in meta.items() if pos in targets]
-        try:
-            min_dist = min(dist for dist, pos in reachable)
-        except ValueError:
+        dist, came_from = search.bfs([start], lambda pos: self.passable(pos.near))
+        aoc.count('nodes expanded', len(dist))
+        reachable = [(dist[pos], pos) for pos in targets if pos in dist]
+        if not reachable:
             return
-        closest = [pos for dist, pos in reachable if dist == min_dist]
-        nearest = sorted(closest, key=reading_order)
-        chosen = nearest[0]
-        while meta[chosen][0] > 1:
-            chosen = meta[chosen][1]
+        chosen = min(reachable)[1]
+        while dist[chosen] > 1:
+            chosen = came_from[chosen]
         return chosen
 
     def update_passable_cache(self):
@@ -189,6 +167,12 @@ class Grid:
         print(msg)
 
     def render_gl(self, status=None, stats=False):
+        import numpy as np
+        import pyglet
+        from pyglet.gl import glTexParameteri, GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST
+        from PIL import Image
+
+        window = gl_window()
         colors = {
             'G': [163, 190, 140],
             'E': [180, 142, 173],
@@ -284,6 +268,7 @@ class Simulation:
             self.grid.move(unit)
             if i == turns - 1:
                 self.rounds += 1
+                aoc.count('rounds')
             outcome = self.check_outcome()
             if outcome:
                 return outcome
@@ -306,7 +291,10 @@ class Simulation2:
     rounds: int = 0
 
     def run(self, verbose=True):
-        for dmg in count(4):
+        checkpoint = aoc.Checkpoint(Simulation2, self.data)
+        state = checkpoint.load()
+        for dmg in count(int(state['dmg']) if state else 4):
+            aoc.gauge('elf damage', dmg)
             if verbose:
                 print(f'checking damage = {dmg}')
             self.rounds = 0
@@ -314,6 +302,9 @@ class Simulation2:
             self.elves = [x for x in self.grid.units if x.symbol == 'E']
             for unit in self.elves:
                 unit.dmg = dmg
+            if state:
+                self.unpack(state)
+                state = None
             # run2
             if verbose:
                 print('Initially:')
@@ -332,10 +323,25 @@ class Simulation2:
                     if verbose:
                         print(f'Outcome:')
                         self.render(dmg)
+                    checkpoint.clear()
                     return outcome
                 if verbose:
                     print(f'After {self.rounds} rounds:')
                     self.render(dmg)
+                if checkpoint.due():
+                    checkpoint.save(dmg=dmg, rounds=self.rounds, units=self.pack())
+
+    def pack(self):
+        '''units as records in the order they were read, so they can be matched up again'''
+        import numpy as np
+        units = [(unit.pos.x, unit.pos.y, unit.hp, unit.dmg) for unit in self.grid.units]
+        return np.array(units, dtype=[('x', 'i4'), ('y', 'i4'), ('hp', 'i4'), ('dmg', 'i4')])
+
+    def unpack(self, state):
+        self.rounds = int(state['rounds'])
+        for unit, (x, y, hp, dmg) in zip(self.grid.units, state['units'].tolist()):
+            unit.pos, unit.hp, unit.dmg = Point(x, y), hp, dmg
+        self.grid.update_passable_cache()
 
     def render(self, dmg):
         self.grid.render_gl(f'dmg={dmg} round={self.rounds}')
@@ -346,6 +352,7 @@ class Simulation2:
             self.grid.move(unit)
             if i == turns - 1:
                 self.rounds += 1
+                aoc.count('rounds')
             outcome = self.check_outcome()
             if outcome:
                 return outcome
@@ -83,7 +83,7 @@ def part_1(data: aoc.Data):
     return sum(len(looks_like(*test)) >= 3 for test in tests)
 
 
-@aoc.test({})
+@aoc.test({}, timeout=10)
 def part_2(data: aoc.Data):
     first, second = data.split('\n\n\n\n')
     tests = [aoc.Data(x).ints_lines for x in first.split('\n\n')]
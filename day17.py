@@ -3,47 +3,14 @@ from dataclasses import dataclass
 from itertools import product, chain, count
 from typing import List
 
-import numpy as np
-from PIL import Image
-
 import aoc
+from aoc.geometry import Point
 
 stable_states = {'clay', 'still'}
 frame = count()
 scale = 1
 
 
-@dataclass
-class Point:
-    x: int
-    y: int
-
-    def __hash__(self):
-        return hash((self.x, self.y))
-
-    def __eq__(self, other):
-        return (self.x, self.y) == (other.x, other.y)
-
-    def __add__(self, other):
-        return Point(self.x + other.x, self.y + other.y)
-
-    @property
-    def above(self):
-        return self + Point(0, -1)
-
-    @property
-    def below(self):
-        return self + Point(0, 1)
-
-    @property
-    def left(self):
-        return self + Point(-1, 0)
-
-    @property
-    def right(self):
-        return self + Point(1, 0)
-
-
 @dataclass
 class Bounds:
     t: int
@@ -137,6 +104,8 @@ def render_cli(grid, bounds, extra=None):
 
 
 def render_image(grid, bounds):
+    import numpy as np
+    from PIL import Image
     colors = {
         'clay': [59, 66, 82],
         'tap': [180, 142, 173],
@@ -214,6 +183,7 @@ def fill_sides(water, grid):
         grid.dirty.append(fill)
 
 
+@aoc.shared
 def simulate(data):
     clay = [Clay.from_string(x) for x in data.splitlines()]
     grid = Grid({p: 'clay' for p in chain.from_iterable(clay)})
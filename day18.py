@@ -1,12 +1,14 @@
 from collections import Counter
 from dataclasses import dataclass
-from itertools import product, count
+from itertools import product
 
 import numpy as np
 
 import aoc
+from aoc import cycles
 
-open_ground, trees, lumberyard = '.|#'
+symbols = '.|#'
+open_ground, trees, lumberyard = range(len(symbols))
 near8 = {(x, y) for x, y in product((-1, 0, 1), (-1, 0, 1))} - {(0, 0)}
 
 
@@ -15,13 +17,11 @@ class Grid:
     grid: np.array
 
     @classmethod
-    def from_string(cls, data):
-        rows = [list(row) for row in data.splitlines()]
-        grid = np.array(rows)
-        return cls(grid)
+    def from_string(cls, data: aoc.Data):
+        return cls(data.codes(symbols))
 
     def __repr__(self):
-        return '\n'.join(''.join(row) for row in self.grid)
+        return aoc.decode_grid(self.grid, symbols)
 
     def run(self):
         for t in range(10):
@@ -29,20 +29,26 @@ class Grid:
         return self.resource_value
 
     def run_forever(self, goal: int):
-        seen = []
-        start = None
-        for t in count(1):
+        checkpoint = aoc.Checkpoint(Grid, self.grid.tobytes(), self.grid.shape, goal)
+        state = checkpoint.load()
+        if state:
+            self.grid = state['grid']
+            history = cycles.History(state['keys'].tolist(), state['values'].tolist())
+        else:
+            history = cycles.History([cycles.fingerprint(self.grid.tobytes())], [self.resource_value])
+        while True:
+            if checkpoint.due():
+                checkpoint.save(
+                    grid=self.grid,
+                    keys=np.array(history.keys, dtype=np.uint64),
+                    values=np.array(history.values, dtype=np.int64),
+                )
             self.advance_time()
-            r = self.resource_value
-            if r not in seen:
-                start = None
-            elif start is None:
-                start = t + 1
-            if start and t > start + 3 and r == seen[start]:
-                size = t - start
-                return seen[start + (goal - 1 - start) % (size - 1)]
-            print(t, end='\r')
-            seen.append(r)
+            aoc.count('minutes')
+            cycle = history.add(cycles.fingerprint(self.grid.tobytes()), self.resource_value)
+            if cycle:
+                checkpoint.clear()
+                return cycle.at(goal)
 
     def advance_time(self):
         before = self.grid.copy()
@@ -71,8 +77,7 @@ class Grid:
 
     @property
     def resource_value(self):
-        c = Counter(self.grid.flatten())
-        return c[trees] * c[lumberyard]
+        return int(np.count_nonzero(self.grid == trees) * np.count_nonzero(self.grid == lumberyard))
 
 
 examples = {
@@ -1,4 +1,5 @@
 import aoc
+from aoc.metrics import block
 
 
 examples = {
@@ -34,21 +35,26 @@ codes = {
 }
 
 
-def run_program(code):
-    r = [0, 0, 0, 0, 0, 0]
+def run_program(code, r0=0):
+    r = [r0, 0, 0, 0, 0, 0]
     ipr, *program = code.splitlines()
     ipr = int(ipr.split()[1])
     lines = dict(enumerate(program))
 
-    ip = 0
+    ip = n = 0
     while True:
         i, *args = lines[ip].split()
         a, b, c = [int(x) for x in args]
         r[ipr] = ip
         r[c] = codes[i](r, a, b)
+        n += 1
+        if n == block:
+            aoc.count('instructions', n)
+            n = 0
         ip = r[ipr] + 1
         # print(f'{n} ip={ip} {bef} {lines[ip]} {r}')
         if ip not in lines:
+            aoc.count('instructions', n)
             return r[0]
 
 
@@ -58,18 +64,24 @@ def run_optimized(code, r0):
     ipr = int(ipr.split()[1])
     lines = dict(enumerate(program))
 
-    ip = 0
+    ip = n = 0
     while True:
         i, *args = lines[ip].split()
         a, b, c = [int(x) for x in args]
         r[ipr] = ip
+        n += 1
         if ip == 1:
+            aoc.count('instructions', n)
             divisors = [x for x in range(1, r[5] + 1) if not r[5] % x]
             return sum(divisors)
         else:
             r[c] = codes[i](r, a, b)
+        if n == block:
+            aoc.count('instructions', n)
+            n = 0
         ip = r[ipr] + 1
         if ip not in lines:
+            aoc.count('instructions', n)
             return r[0]
 
 
@@ -81,3 +93,8 @@ def part_1(data: aoc.Data):
 @aoc.test({})
 def part_2(data: aoc.Data):
     return run_optimized(data, 1)
+
+
+@aoc.reference('part_2', scale=20, real=False)
+def reference_part_2(data: aoc.Data):
+    return run_program(data, 1)
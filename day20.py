@@ -1,22 +1,14 @@
 from dataclasses import dataclass
 
 import aoc
-
-
-@dataclass(frozen=True)
-class Point:
-    x: int = 0
-    y: int = 0
-
-    def __add__(self, other):
-        return Point(self.x + other.x, self.y + other.y)
-
+from aoc import search
+from aoc.geometry import Point, up, down, left, right
 
 moves = {
-    'N': Point(0, -1),
-    'S': Point(0, 1),
-    'W': Point(-1, 0),
-    'E': Point(1, 0),
+    'N': up,
+    'S': down,
+    'W': left,
+    'E': right,
 }
 
 doors = {
@@ -77,20 +69,7 @@ class Grid:
         return g
 
     def find_room_distances(self):
-        start = Point()
-        visited = {start}
-        frontier = [(0, start)]
-        dists = {start: 0}
-        while frontier:
-            dist, pos = frontier.pop(0)
-            for n in self.neighbours(pos):
-                if n in visited:
-                    continue
-                if n not in dists or dists[n] > dist + 1:
-                    dists[n] = dist + 1
-                visited.add(n)
-                frontier.append((dist + 1, n))
-        return dists
+        return search.distances([Point()], self.neighbours)
 
     def neighbours(self, point):
         return [
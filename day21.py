@@ -1,4 +1,9 @@
+from collections import deque
+from itertools import islice
+
 import aoc
+from aoc import cycles
+from aoc.metrics import block
 
 
 codes = {
@@ -21,30 +26,38 @@ codes = {
 }
 
 
-def run_program(code, part=1):
+def run_program(code, part=1, shortcut=True):
     r = [0, 0, 0, 0, 0, 0]
     ipr, *program = code.splitlines()
     ipr = int(ipr.split()[1])
     lines = dict(enumerate(program))
-    ip = 0
+    ip = n = 0
     while True:
         i, *args = lines[ip].split()
         a, b, c = map(int, args)
         r[ipr] = ip
+        n += 1
+        if n == block:
+            aoc.count('instructions', n)
+            n = 0
 
         # addi 2 1 2
-        if ip == 24:
+        if shortcut and ip == 24:
             r[2] = r[3] // 256
         else:
             r[c] = codes[i](r, a, b)
 
         # eqrr 4 0 2
         if ip == 28:
+            # the caller may stop here
+            aoc.count('instructions', n)
+            n = 0
             yield r[4]
 
         ip = r[ipr] + 1
 
         if ip not in lines:
+            aoc.count('instructions', n)
             return 'halt'
 
 
@@ -55,9 +68,24 @@ def part_1(data: aoc.Data):
 
 @aoc.test({})
 def part_2(data: aoc.Data):
+    # the last value before the first repeat, or the last one if the program halts first
+    found = cycles.brent(lambda: run_program(data, part=2))
+    if found is None:
+        return deque(run_program(data, part=2), maxlen=1)[0]
+    mu, lam = found
+    return next(islice(run_program(data, part=2), mu + lam - 1, None))
+
+
+@aoc.reference('part_1')
+def reference_part_1(data: aoc.Data):
+    return next(run_program(data, shortcut=False))
+
+
+@aoc.reference('part_2', scale=16, real=False)
+def reference_part_2(data: aoc.Data):
     seen = set()
     last = None
-    for r4 in run_program(data, part=2):
+    for r4 in run_program(data, part=2, shortcut=False):
         if r4 in seen:
             return last
         seen.add(r4)
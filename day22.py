@@ -1,19 +1,8 @@
-from dataclasses import dataclass
 from typing import Dict
 
-import click
-import networkx as nx
-
 import aoc
-
-
-@dataclass(frozen=True)
-class Point:
-    x: int = 0
-    y: int = 0
-
-    def __add__(self, other):
-        return Point(self.x + other.x, self.y + other.y)
+from aoc import search
+from aoc.geometry import Point
 
 
 class Grid:
@@ -38,8 +27,8 @@ class Grid:
             return point.x * 16807
         if point.x == 0:
             return point.y * 48271
-        left = point + Point(-1, 0)
-        top = point + Point(0, -1)
+        left = point.left
+        top = point.above
         return self.erosion_level(left) * self.erosion_level(top)
 
     def erosion_level(self, point: Point):
@@ -49,44 +38,44 @@ class Grid:
 
 
 class RescueOperation(Grid):
-    regions = ['rocky', 'wet', 'narrow']
-    valid_tools = {
-        'rocky': {'climbing gear', 'torch'},
-        'wet': {'climbing gear', 'neither'},
-        'narrow': {'torch', 'neither'},
-    }
+    # a tool can't be used in the region type with the same index
+    tools = ['neither', 'torch', 'climbing gear']
+    torch = 1
 
     def dijkstra(self, margin=20):
-        G = nx.Graph()
-        start = (self.mouth, 'torch')
-        target = (self.target, 'torch')
-
-        for x in range(self.target.x + margin):
-            for y in range(self.target.y + margin):
-                point = Point(x, y)
-
-                # switch tool
-                tool, other_tool = self.tools(point)
-                G.add_edge((point, tool), (point, other_tool), weight=7)
-
-                # move to adjacent region
-                for dx, dy in [(1, 0), (0, 1)]:
-                    move = point + Point(dx, dy)
-                    for tool in self.tools(point) & self.tools(move):
-                        G.add_edge((point, tool), (move, tool), weight=1)
-
-        self.render(nx.dijkstra_path(G, start, target))
-        return nx.dijkstra_path_length(G, start, target)
-
-    def region(self, point):
-        """Region type at coordinate."""
-        return self.regions[self.erosion_level(point) % 3]
-
-    def tools(self, point):
-        """Tools usable at coordinate."""
-        return self.valid_tools[self.region(point)]
+        '''A* over regions with a tool in hand, packed into ints, looking at most margin past the target'''
+        width, height = self.target.x + margin, self.target.y + margin
+        goal = (self.target.y * width + self.target.x) * 3 + self.torch
+
+        def neighbours(state):
+            cell, tool = divmod(state, 3)
+            y, x = divmod(cell, width)
+            # switch to the other tool usable here
+            yield state - tool + 3 - self.region(x, y) - tool, 7
+            for nx, ny in (x, y - 1), (x - 1, y), (x + 1, y), (x, y + 1):
+                if 0 <= nx < width and 0 <= ny < height and self.region(nx, ny) != tool:
+                    yield (ny * width + nx) * 3 + tool, 1
+
+        def heuristic(state):
+            cell, tool = divmod(state, 3)
+            y, x = divmod(cell, width)
+            return abs(x - self.target.x) + abs(y - self.target.y) + 7 * (tool != self.torch)
+
+        dist, came_from = search.dijkstra([self.torch], neighbours, goal, heuristic)
+        path = []
+        for state in search.path(came_from, goal):
+            cell, tool = divmod(state, 3)
+            y, x = divmod(cell, width)
+            path.append((Point(x, y), self.tools[tool]))
+        self.render(path)
+        return dist[goal]
+
+    def region(self, x, y):
+        """Region type index at coordinate."""
+        return self.erosion_level(Point(x, y)) % 3
 
     def render(self, path):
+        import click
         path = {p: t for p, t in path}
         right = max(p.x for p in path)
         bottom = max(p.y for p in path)
@@ -107,19 +96,46 @@ example = '''
     '''
 
 
-@aoc.test({example: 114})
-def part_1(data: aoc.Data):
+@aoc.shared
+def survey_cave(data):
+    '''cave with erosion levels up to the target filled in, part 2 keeps extending them'''
     a, b = data.ints_lines
     depth = a[0]
     target = Point(*b)
-    return Grid(depth, target).survey()
+    grid = RescueOperation(depth, target)
+    grid.survey()
+    return grid
+
+
+@aoc.test({example: 114})
+def part_1(data: aoc.Data):
+    return survey_cave(data).survey()
 
 
 @aoc.test({example: 45})
 def part_2(data: aoc.Data):
-    a, b = data.ints_lines
-    depth = a[0]
-    target = Point(*b)
-    grid = RescueOperation(depth, target)
-    grid.survey()
-    return grid.dijkstra()
+    return survey_cave(data).dijkstra()
+
+
+def erosion_levels(depths, targets):
+    '''erosion of many caves at once, one anti-diagonal at a time since a region depends on its left and top'''
+    import numpy as np
+    depth = np.asarray(depths)[:, None]
+    tx, ty = np.asarray(targets).T[:, :, None]
+    width, height = tx.max() + 1, ty.max() + 1
+    erosion = np.zeros((len(depths), height, width), dtype=np.int64)
+    for k in range(width + height - 1):
+        y = np.arange(max(0, k - width + 1), min(height, k + 1))
+        x = k - y
+        index = erosion[:, y - 1, x] * erosion[:, y, x - 1]
+        index = np.where(y == 0, x * 16807, np.where(x == 0, y * 48271, index))
+        index[(x == tx) & (y == ty)] = 0
+        erosion[:, y, x] = (index + depth) % 20183
+    return erosion
+
+
+@aoc.batched('part_1')
+def batch_part_1(datas):
+    caves = [data.ints_lines for data in datas]
+    erosion = erosion_levels([a[0] for a, b in caves], [b for a, b in caves])
+    return [int((e[:b[1] + 1, :b[0] + 1] % 3).sum()) for e, (a, b) in zip(erosion, caves)]
@@ -1,10 +1,10 @@
 from dataclasses import dataclass
-from operator import attrgetter
 from collections import Counter, defaultdict
-from itertools import combinations
+from bisect import bisect_left
+from heapq import heappop, heappush
+from itertools import combinations, product
 
-from z3 import Ints, Int, If, Optimize, Sum
-import networkx as nx
+import numpy as np
 
 import aoc
 
@@ -33,11 +33,17 @@ example = '''
     '''
 
 
-@aoc.test({example: 7})
+@aoc.test({example: 7}, stream=True)
 def part_1(data: aoc.Data):
-    bots = [Nanobot(*x) for x in data.ints_lines]
-    strongest = max(bots, key=attrgetter('r'))
-    return sum(1 for x in bots if strongest.distance(x) <= strongest.r)
+    *strongest, r = max((bots[bots[:, 3].argmax()] for bots in data.ints_chunks()), key=lambda bot: bot[3])
+    return sum(int(np.sum(np.abs(bots[:, :3] - strongest).sum(axis=1) <= r)) for bots in data.ints_chunks())
+
+
+@aoc.reference('part_1')
+def reference_part_1(data: aoc.Data):
+    bots = [Nanobot(*bot) for bot in data.ints_lines]
+    strongest = max(bots, key=lambda bot: bot.r)
+    return sum(strongest.distance(bot) <= strongest.r for bot in bots)
 
 
 example_2 = '''
@@ -51,6 +57,7 @@ example_2 = '''
 
 
 def solve_z3(bots):
+    from z3 import Ints, Int, If, Optimize, Sum
     
     def Abs(x):
         return If(x >= 0, x, -x)
@@ -81,6 +88,7 @@ def solve_z3(bots):
 
 
 def solve_nx(bots):
+    import networkx as nx
 
     def manhattan_distance(a, b):
         return abs(a.x - b.x) + abs(a.y - b.y) + abs(a.z - b.z)
@@ -102,3 +110,73 @@ def solve_nx(bots):
 def part_2(data: aoc.Data):
     # return solve_z3(data.ints_lines)
     return solve_nx(data.ints_lines)
+
+
+def closest_common(bots):
+    '''
+    Distance from the origin to the closest point in range of every bot, None if there is no such point.
+
+    With a = x+y+z, b = x+y-z, c = x-y+z, d = -x+y+z a bot's range is an interval on each of them,
+    the distance from the origin is the largest of |a|, |b|, |c| and |d|, and a point needs a = b+c+d
+    with all four of the same parity. So a distance is reachable when the intervals clipped to it still meet.
+    '''
+    rotated = [((b.x + b.y + b.z, b.x + b.y - b.z, b.x - b.y + b.z, -b.x + b.y + b.z), b.r) for b in bots]
+    lo = [max(v[k] - r for v, r in rotated) for k in range(4)]
+    hi = [min(v[k] + r for v, r in rotated) for k in range(4)]
+
+    def reachable(t):
+        for parity in (0, 1):
+            low = [max(v, -t) for v in lo]
+            low = [v + (v - parity) % 2 for v in low]
+            high = [min(v, t) for v in hi]
+            high = [v - (v - parity) % 2 for v in high]
+            meet = max(low[0], sum(low[1:])) <= min(high[0], sum(high[1:]))
+            if meet and all(l <= h for l, h in zip(low, high)):
+                return True
+        return False
+
+    top = max(map(abs, lo + hi))
+    if reachable(top):
+        return bisect_left(range(top + 1), True, key=reachable)
+
+
+def solve_boxes(bots):
+    '''
+    Split a cube around every bot into eighths, always looking at the box in range of the most bots first.
+
+    Once the bots reaching a box have a point in common, the closest such point is the best one the box can offer,
+    so it goes back on the heap as an answer instead of the box being split further.
+    '''
+    bots = [Nanobot(*bot) for bot in bots]
+
+    def gap(lo, size, value):
+        return max(lo - value, 0, value - (lo + size - 1))
+
+    def reaching(corner, size):
+        return [b for b in bots if sum(gap(lo, size, v) for lo, v in zip(corner, (b.x, b.y, b.z))) <= b.r]
+
+    def from_origin(corner, size):
+        return sum(gap(lo, size, 0) for lo in corner)
+
+    lo = min(min(b.x, b.y, b.z) - b.r for b in bots)
+    hi = max(max(b.x, b.y, b.z) + b.r for b in bots)
+    size = 1 << (hi - lo).bit_length()
+    corner = (lo, lo, lo)
+    heap = [(-len(bots), from_origin(corner, size), size, corner)]
+    while True:
+        count, distance, size, corner = heappop(heap)
+        if size == 0:
+            return distance
+        common = closest_common(reaching(corner, size))
+        if common is not None:
+            heappush(heap, (count, common, 0, corner))
+            continue
+        size //= 2
+        for offset in product((0, size), repeat=3):
+            box = tuple(c + o for c, o in zip(corner, offset))
+            heappush(heap, (-len(reaching(box, size)), from_origin(box, size), size, box))
+
+
+@aoc.reference('part_2', scale=20)
+def reference_part_2(data: aoc.Data):
+    return solve_boxes(data.ints_lines)
@@ -7,8 +7,6 @@ from operator import attrgetter
 
 import aoc
 
-import click
-
 DEBUG = False
 unit_id = count()
 unit_re = re.compile(
@@ -95,6 +93,7 @@ class Fight:
         r = count(1)
         while not outcome:
             log(f'round {next(r)}'.center(80, '-'))
+            aoc.count('rounds')
             attacking, defending = self.switch_sides()
             log('Attacking:')
             for group in attacking:
@@ -179,8 +178,13 @@ class Fight:
 
 
 def optimize_boost(data, boost_to):
-    for boost in count():
+    checkpoint = aoc.Checkpoint(optimize_boost, data, boost_to)
+    state = checkpoint.load()
+    for boost in count(int(state['boost']) if state else 0):
+        if checkpoint.due():
+            checkpoint.save(boost=boost)
         log(f'boost {boost}')
+        aoc.gauge('boost', boost)
         groups = parse_input(data)
         for group in groups[boost_to]:
             group.damage += boost
@@ -190,6 +194,7 @@ def optimize_boost(data, boost_to):
         except EndlessFight:
             continue
         if sum(group.units for group in fight.armies[boost_to]) > 0:
+            checkpoint.clear()
             return outcome
 
 
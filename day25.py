@@ -1,7 +1,5 @@
 from itertools import combinations
 
-import networkx as nx
-
 import aoc
 
 
@@ -60,6 +58,7 @@ def manhattan_distance(a, b):
 
 
 def find_constellations(points):
+    import networkx as nx
     G = nx.Graph()
     G.add_nodes_from(points)
     G.add_edges_from(